@@ -8,7 +8,7 @@ Uses OpenAI-compatible /v1/chat/completions endpoint.
 Key functions:
 1. Strip unsupported request fields (tools, stream_options, store)
 2. Replace massive system prompt with minimal one (2048-token context)
-3. Force stream:false, convert response to SSE if client requested streaming
+3. Force stream:false, stream the response back as SSE if client requested it
 4. Fix response: nanosecond timestamps, missing usage/system_fingerprint
 5. Fake /api/show to avoid hailo-ollama DTO crash
 6. Expose /v1/models for OpenAI-compatible model discovery clients
@@ -16,15 +16,28 @@ Key functions:
 Listens on port 8081, forwards to hailo-ollama on port 8000.
 """
 
+import functools
+import http.client
 import http.server
 import json
+import logging
+import logging.handlers
 import os
 import re
+import stat
 import sys
+import threading
 import time
 import itertools
-import urllib.request
-import urllib.error
+import queue
+import urllib.parse
+
+try:
+    import orjson
+except ImportError:  # optional: python3-orjson; stdlib json is the fallback
+    orjson = None
+
+log = logging.getLogger("hailo-sanitize-proxy")
 
 LISTEN_PORT = 8081
 UPSTREAM = "http://127.0.0.1:8000"
@@ -33,14 +46,15 @@ WORKSPACE_SKILLS_DIR = os.path.expanduser("~/.openclaw/workspace/skills")
 MAX_TOOL_DESCRIPTION_CHARS = 120
 MAX_TOOL_COUNT_IN_PROMPT = 8
 UPSTREAM_TIMEOUT = 300  # seconds — generation is slow (~8 tok/s)
-CORS_ALLOWED_ORIGINS = {
+UPSTREAM_POOL_SIZE = 8  # idle keep-alive connections kept to upstream
+CORS_ALLOWED_ORIGINS = frozenset(
     item.strip()
     for item in os.environ.get(
         "HAILO_PROXY_ALLOWED_ORIGINS",
         "http://localhost:8787,http://127.0.0.1:8787",
     ).split(",")
     if item.strip()
-}
+)
 CORS_ALLOW_NO_ORIGIN = os.environ.get("HAILO_PROXY_ALLOW_NO_ORIGIN", "1").strip().lower() not in {
     "0", "false", "no", "off"
 }
@@ -49,14 +63,21 @@ CORS_ALLOW_HEADERS = os.environ.get(
     "HAILO_PROXY_CORS_ALLOW_HEADERS",
     "Authorization, Content-Type, X-Requested-With",
 )
-ALLOWED_HOSTS = {
+# Origin-independent CORS response headers, built once.
+CORS_STATIC_HEADERS = (
+    ("Vary", "Origin"),
+    ("Access-Control-Allow-Methods", CORS_ALLOW_METHODS),
+    ("Access-Control-Allow-Headers", CORS_ALLOW_HEADERS),
+    ("Access-Control-Max-Age", "86400"),
+)
+ALLOWED_HOSTS = frozenset(
     item.strip().lower()
     for item in os.environ.get(
         "HAILO_PROXY_ALLOWED_HOSTS",
         "127.0.0.1:8081,localhost:8081,[::1]:8081,127.0.0.1,localhost,[::1]",
     ).split(",")
     if item.strip()
-}
+)
 
 
 def _env_int(name, default):
@@ -69,48 +90,121 @@ def _env_int(name, default):
         return default
 
 
-TRACE_ENABLED = os.environ.get("HAILO_PROXY_TRACE", "1").strip().lower() not in {
-    "0", "false", "no", "off"
+# Per-request trace files under TRACE_DIR; off by default to keep disk
+# writes out of the request path.
+TRACE_ENABLED = os.environ.get("HAILO_PROXY_TRACE", "0").strip().lower() in {
+    "1", "true", "yes", "on"
+}
+# Per-request /tmp/hailo-proxy-*.json|txt debug dumps (tools, system prompts).
+DEBUG_DUMPS = os.environ.get("HAILO_PROXY_DEBUG", "0").strip().lower() in {
+    "1", "true", "yes", "on"
 }
 TRACE_DIR = os.environ.get("HAILO_PROXY_TRACE_DIR", "/tmp/hailo-proxy-traces")
 TRACE_MAX_BYTES = _env_int("HAILO_PROXY_TRACE_MAX_BYTES", 250000)
 MAX_PROXY_COMPLETION_TOKENS = _env_int("HAILO_PROXY_MAX_TOKENS", 128)
 MAX_HISTORY_MESSAGES = _env_int("HAILO_PROXY_MAX_HISTORY_MESSAGES", 1)
+MODELS_CACHE_TTL = _env_int("HAILO_PROXY_MODELS_TTL", 30)  # seconds
 _TRACE_SEQ = itertools.count(1)
+# Tool-call ids: process start stamp + counter, unique across calls and restarts.
+_CALL_ID_PREFIX = "call_%d_" % int(time.time())
+_CALL_SEQ = itertools.count(1)
+_UPSTREAM_IDLE = queue.LifoQueue(maxsize=UPSTREAM_POOL_SIZE)
+# Trace and debug file writes run on one background thread so /tmp (SD card)
+# latency never sits on a request path; the queue is bounded so a slow disk or
+# a repeating upstream failure can't pile up request bodies in memory.
+_BACKGROUND_JOBS = queue.Queue(maxsize=64)
+_BACKGROUND_WORKER = None
+_BACKGROUND_LOCK = threading.Lock()
+RELAY_CHUNK_BYTES = 65536
+# Passthrough responses keep upstream headers except framing/connection ones
+# (we re-frame the body) and the ones send_response() already emits.
+RELAY_SKIP_RESPONSE_HEADERS = frozenset({
+    "transfer-encoding", "connection", "keep-alive", "server", "date",
+})
+# Client request headers never forwarded upstream: RFC 7230 hop-by-hop
+# headers (the pooled upstream connection manages its own keep-alive),
+# ones we recompute, and browser CORS headers hailo-ollama doesn't need.
+FORWARD_SKIP_REQUEST_HEADERS = frozenset({
+    "host", "content-length", "transfer-encoding",
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "trailers", "upgrade",
+    "origin", "access-control-request-method", "access-control-request-headers",
+})
+
+# 403 bodies are {"error": <reason>, "details": <header value>}; only the
+# details vary, so the rest is serialized once per reason.
+_DENY_BODY_PREFIXES = {
+    reason: b'{"error":%s,"details":' % json.dumps(reason).encode("utf-8")
+    for reason in ("forbidden host", "forbidden origin")
+}
 
 MINIMAL_SYSTEM_PROMPT = (
     "You are a helpful personal assistant. "
     "Answer the user's questions concisely and helpfully. "
     "If you don't know something, say so."
 )
+MINIMAL_SYSTEM_LEN = len(MINIMAL_SYSTEM_PROMPT)
 
-ALLOWED_CHAT_FIELDS = {
+ALLOWED_CHAT_FIELDS = frozenset({
     "model", "messages", "temperature", "top_p", "n", "stream",
     "max_tokens", "max_completion_tokens", "presence_penalty",
     "frequency_penalty", "seed", "tools", "tool_choice",
     "parallel_tool_calls",
-}
-ALLOWED_MESSAGE_FIELDS = {
+})
+ALLOWED_MESSAGE_FIELDS = frozenset({
     "role", "content", "tool_calls", "name", "tool_call_id"
-}
+})
 TOOL_INTENT_TOKENS = (
     " use ", " tool", "skill", "/rag", "rag ", "molt", "run ", "execute"
 )
+# All tokens in one alternation: a single C-level scan per user turn.
+_TOOL_INTENT_RE = re.compile("|".join(map(re.escape, TOOL_INTENT_TOKENS)))
 
 # Tools the 1.5B model can't invoke correctly — suppress these.
 # File tools: model generates absolute paths outside sandbox → always fails.
 # Session tools: model can't format array arguments correctly.
 # Search/process: model loops endlessly on these.
 # Only "exec" is allowed through (proxy can normalize the command).
-BLOCKED_TOOL_NAMES = {
+BLOCKED_TOOL_NAMES = frozenset({
     "read", "write", "edit", "search", "process",
     "sessions_list", "sessions_history", "sessions_send",
     "sessions_spawn", "session_status",
-}
+})
+
+# (signature, rendered <available_skills> block), rebuilt only when a SKILL.md
+# changes. Swapped as one tuple so concurrent handler threads never see a
+# signature paired with another signature's block.
+_SKILLS_CACHE = (None, "")
+# Serialized /v1/models body and its monotonic expiry; clients poll this
+# endpoint, so upstream /api/tags is asked at most once per TTL.
+_MODELS_CACHE = (0.0, None)
+_SKILLS_OPEN_TAG = "<available_skills>"
+_SKILLS_CLOSE_TAG = "</available_skills>"
+
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(value):
+        try:
+            return orjson.dumps(value)
+        except TypeError:
+            # orjson rejects ints wider than 64 bits and non-str keys.
+            return json.dumps(value).encode("utf-8")
+
+    def _dumps_str(value):
+        return _dumps(value).decode("utf-8")
+else:
+    _loads = json.loads
+
+    def _dumps(value):
+        return json.dumps(value).encode("utf-8")
+
+    _dumps_str = functools.partial(json.dumps, ensure_ascii=False)
 
 
 def _next_trace_id():
-    return f"{int(time.time() * 1000)}-{next(_TRACE_SEQ):06d}"
+    return f"{time.time_ns() // 1_000_000}-{next(_TRACE_SEQ):06d}"
 
 
 def _ensure_trace_dir():
@@ -124,15 +218,20 @@ def _ensure_trace_dir():
 
 def _parse_json_dict(body_bytes):
     try:
-        data = json.loads(body_bytes)
+        data = _loads(body_bytes)
     except Exception:
         return None
     return data if isinstance(data, dict) else None
 
 
 def _json_preview(value, limit=220):
+    # Long strings (message content) are clipped before serializing: the
+    # first `limit` output chars are the same either way, and a multi-KB
+    # reply isn't encoded in full just for a log line.
+    if isinstance(value, str) and len(value) > limit:
+        value = value[:limit]
     try:
-        text = json.dumps(value, ensure_ascii=False)
+        text = _dumps_str(value)
     except Exception:
         text = str(value)
     if len(text) > limit:
@@ -140,10 +239,9 @@ def _json_preview(value, limit=220):
     return text
 
 
-def _summarize_request_body(body_bytes):
-    data = _parse_json_dict(body_bytes)
+def _summarize_request_body(data, body_len):
     if data is None:
-        return f"non-json body_bytes={len(body_bytes)}"
+        return f"non-json body_bytes={body_len}"
     keys = sorted(data.keys())
     model = data.get("model")
     stream = data.get("stream")
@@ -176,10 +274,9 @@ def _summarize_request_body(body_bytes):
     )
 
 
-def _summarize_response_body(body_bytes):
-    data = _parse_json_dict(body_bytes)
+def _summarize_response_body(data, body_len):
     if data is None:
-        return f"non-json body_bytes={len(body_bytes)}"
+        return f"non-json body_bytes={body_len}"
     choices = data.get("choices") if isinstance(data.get("choices"), list) else []
     content_preview = ""
     if choices and isinstance(choices[0], dict):
@@ -195,8 +292,7 @@ def _summarize_response_body(body_bytes):
     )
 
 
-def _extract_tool_names(body_bytes):
-    data = _parse_json_dict(body_bytes)
+def _extract_tool_names(data):
     if data is None:
         return set()
     tools = data.get("tools")
@@ -217,8 +313,7 @@ def _extract_tool_names(body_bytes):
     return names
 
 
-def _extract_latest_user_text(body_bytes):
-    data = _parse_json_dict(body_bytes)
+def _extract_latest_user_text(data):
     if data is None:
         return ""
     messages = data.get("messages")
@@ -244,71 +339,94 @@ def _extract_latest_user_text(body_bytes):
 
 
 def _has_explicit_tool_intent(text):
-    normalized = f" {str(text or '').strip().lower()} "
-    if not normalized.strip():
+    stripped = str(text or "").strip().lower()
+    if not stripped:
         return False
-    return any(token in normalized for token in TOOL_INTENT_TOKENS)
+    return _TOOL_INTENT_RE.search(f" {stripped} ") is not None
 
 
 def _write_trace(trace_id, suffix, body_bytes):
+    """Queue a trace file write; the file I/O happens on the background thread."""
     if not TRACE_ENABLED:
         return
+    payload = body_bytes if isinstance(body_bytes, (bytes, bytearray)) else str(body_bytes).encode("utf-8", errors="replace")
+    if len(payload) > TRACE_MAX_BYTES:
+        marker = (
+            f"\n\n...TRUNCATED... original_bytes={len(payload)} limit={TRACE_MAX_BYTES}\n"
+        ).encode("utf-8")
+        payload = payload[:TRACE_MAX_BYTES] + marker
+    else:
+        # Snapshot: the request buffer is a bytearray owned by the handler.
+        payload = bytes(payload)
+    _submit_background(_write_trace_file, f"{trace_id}-{suffix}", payload)
+
+
+def _write_trace_file(name, payload):
     _ensure_trace_dir()
+    with open(os.path.join(TRACE_DIR, name), "wb") as f:
+        f.write(payload)
+
+
+def _run_background_jobs():
+    while True:
+        fn, args = _BACKGROUND_JOBS.get()
+        try:
+            fn(*args)
+        except Exception:
+            pass
+
+
+def _submit_background(fn, *args):
+    """Queue fn(*args) for the background I/O thread; dropped if backlogged."""
+    global _BACKGROUND_WORKER
+    if _BACKGROUND_WORKER is None:
+        with _BACKGROUND_LOCK:
+            if _BACKGROUND_WORKER is None:
+                _BACKGROUND_WORKER = threading.Thread(
+                    target=_run_background_jobs, name="hailo-proxy-io", daemon=True
+                )
+                _BACKGROUND_WORKER.start()
+    try:
+        _BACKGROUND_JOBS.put_nowait((fn, args))
+    except queue.Full:
+        log.info("hailo-sanitize-proxy: background I/O backlog full, dropping %s", fn.__name__)
+
+
+def _dump_500_bodies(ts, original_body, body):
+    """Keep the raw + sanitized request that made upstream return 500."""
     try:
-        payload = body_bytes if isinstance(body_bytes, (bytes, bytearray)) else str(body_bytes).encode("utf-8", errors="replace")
-        if len(payload) > TRACE_MAX_BYTES:
-            marker = (
-                f"\n\n...TRUNCATED... original_bytes={len(payload)} limit={TRACE_MAX_BYTES}\n"
-            ).encode("utf-8")
-            payload = payload[:TRACE_MAX_BYTES] + marker
-        path = os.path.join(TRACE_DIR, f"{trace_id}-{suffix}")
-        with open(path, "wb") as f:
-            f.write(payload)
+        with open(f"/tmp/hailo-proxy-500-raw-{ts}.json", "wb") as f:
+            f.write(original_body or b"")
+        with open(f"/tmp/hailo-proxy-500-sanitized-{ts}.json", "wb") as f:
+            f.write(body or b"")
     except Exception:
         pass
 
 
-def sanitize_chat_body(body_bytes, tool_prompt_enabled=True):
-    """Strip unsupported fields from /v1/chat/completions request."""
-    try:
-        data = json.loads(body_bytes)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        return body_bytes
-    if not isinstance(data, dict):
-        return body_bytes
-
-    sanitized = {
-        k: v for k, v in data.items() if k in ALLOWED_CHAT_FIELDS and v is not None
-    }
+def sanitize_chat_dict(data, tool_prompt_enabled=True):
+    """Strip unsupported fields from a parsed /v1/chat/completions request.
+
+    Returns (sanitized_dict, client_wants_stream) so callers don't re-parse the
+    body just to read the client's `stream` flag; `data` is not modified.
+    """
+    client_wants_stream = bool(data.get("stream"))
+
+    if data.keys() <= ALLOWED_CHAT_FIELDS and None not in data.values():
+        sanitized = dict(data)
+    else:
+        sanitized = {
+            k: v for k, v in data.items() if k in ALLOWED_CHAT_FIELDS and v is not None
+        }
     tools_payload = sanitized.pop("tools", None)
     if not tool_prompt_enabled:
         tools_payload = None
-    if tools_payload is not None:
+    if DEBUG_DUMPS and tools_payload is not None:
         try:
             with open("/tmp/hailo-proxy-tools.json", "w", encoding="utf-8") as f:
                 json.dump(tools_payload, f, indent=2)
         except Exception:
             pass
 
-    if "messages" in sanitized and isinstance(sanitized["messages"], list):
-        clean_msgs = []
-        for msg in sanitized["messages"]:
-            if not isinstance(msg, dict):
-                continue
-            clean_msg = {k: v for k, v in msg.items() if k in ALLOWED_MESSAGE_FIELDS}
-            if isinstance(clean_msg.get("content"), list):
-                parts = []
-                for part in clean_msg["content"]:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        parts.append(part.get("text", ""))
-                    elif isinstance(part, str):
-                        parts.append(part)
-                clean_msg["content"] = "\n".join(parts)
-            if clean_msg.get("content") is None:
-                clean_msg["content"] = ""
-            clean_msgs.append(clean_msg)
-        sanitized["messages"] = clean_msgs
-
     sanitized["stream"] = False
 
     max_tokens = sanitized.get("max_tokens")
@@ -324,50 +442,97 @@ def sanitize_chat_body(body_bytes, tool_prompt_enabled=True):
     if isinstance(sanitized.get("n"), int) and sanitized["n"] > 1:
         sanitized["n"] = 1
 
-    if "messages" in sanitized:
+    if isinstance(sanitized.get("messages"), list):
         tool_prompt = build_tool_prompt(tools_payload)
         sanitized["messages"] = simplify_messages(sanitized["messages"], tool_prompt)
 
-    return json.dumps(sanitized).encode("utf-8")
+    return sanitized, client_wants_stream
+
+
+def _message_text(content):
+    """Flatten OpenAI content parts to plain text; None becomes ""."""
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                parts.append(part.get("text", ""))
+            elif isinstance(part, str):
+                parts.append(part)
+        return "\n".join(parts)
+    if content is None:
+        return ""
+    return content
+
+
+def _clean_message(msg):
+    """Keep only the fields upstream accepts, with string content."""
+    # Plain {role, content: str} messages (the OpenAI SDK norm) are already
+    # clean; reuse them instead of rebuilding.
+    if msg.keys() <= ALLOWED_MESSAGE_FIELDS and isinstance(msg.get("content"), str):
+        return msg
+    clean_msg = {k: v for k, v in msg.items() if k in ALLOWED_MESSAGE_FIELDS}
+    clean_msg["content"] = _message_text(clean_msg.get("content"))
+    return clean_msg
 
 
 def simplify_messages(messages, tool_prompt=None):
-    """Replace OpenClaw's massive system prompt with a minimal one."""
+    """Replace OpenClaw's massive system prompt with a minimal one.
+
+    Cleans and classifies the raw client messages in a single pass: only user
+    messages are cleaned and kept, system contents are just measured.
+    """
     if not messages:
         return messages
     # Keep only user messages to avoid confusing the model with orphaned
     # tool/assistant messages (which cause "I can't help with that" refusals).
-    user_msgs = [m for m in messages if m.get("role") == "user"]
+    user_msgs = []
+    original_sys_msgs = []
+    for m in messages:
+        if not isinstance(m, dict):
+            continue
+        role = m.get("role")
+        if role == "user":
+            user_msgs.append(_clean_message(m))
+        elif role == "system":
+            original_sys_msgs.append(_message_text(m.get("content")))
     if len(user_msgs) > MAX_HISTORY_MESSAGES:
         user_msgs = user_msgs[-MAX_HISTORY_MESSAGES:]
-    other_msgs = user_msgs
-    original_sys_msgs = [m.get("content", "") for m in messages if m.get("role") == "system"]
-    original_sys_len = sum(len(c) for c in original_sys_msgs)
-    if original_sys_len > len(MINIMAL_SYSTEM_PROMPT):
-        sys.stderr.write(
-            "hailo-sanitize-proxy: replaced system prompt (%d -> %d chars)\n"
-            % (original_sys_len, len(MINIMAL_SYSTEM_PROMPT))
+    original_sys_len = sum(map(len, original_sys_msgs))
+    if original_sys_len > MINIMAL_SYSTEM_LEN:
+        log.info(
+            "hailo-sanitize-proxy: replaced system prompt (%d -> %d chars)",
+            original_sys_len, MINIMAL_SYSTEM_LEN,
         )
-        sys.stderr.flush()
-        if original_sys_msgs:
+        if DEBUG_DUMPS and original_sys_msgs:
             dump_path = "/tmp/hailo-proxy-system-prompt.txt"
             try:
                 with open(dump_path, "w", encoding="utf-8") as f:
                     f.write("\n\n".join(original_sys_msgs))
             except Exception:
                 pass
+    system_msg = build_system_message(tool_prompt or "", build_skills_block_from_workspace())
+    return [system_msg] + user_msgs
+
+
+@functools.lru_cache(maxsize=16)
+def build_system_message(tool_prompt, skills_block):
+    """Assemble the replacement system message; memoized per tool/skills combo.
+
+    The returned dict is shared between requests and must not be mutated.
+    """
     system_content = MINIMAL_SYSTEM_PROMPT
-    skills_block = build_skills_block_from_workspace()
     if tool_prompt:
         system_content = f"{system_content}\n\n{tool_prompt}"
     if skills_block:
         system_content = f"{system_content}\n\nAvailable skills:\n{skills_block}"
-    try:
-        with open("/tmp/hailo-proxy-sanitized-system-prompt.txt", "w", encoding="utf-8") as f:
-            f.write(system_content)
-    except Exception:
-        pass
-    return [{"role": "system", "content": system_content}] + other_msgs
+    # Only reached on a cache miss, so the dump tracks each distinct prompt once.
+    if DEBUG_DUMPS:
+        try:
+            with open("/tmp/hailo-proxy-sanitized-system-prompt.txt", "w", encoding="utf-8") as f:
+                f.write(system_content)
+        except Exception:
+            pass
+    return {"role": "system", "content": system_content}
 
 
 def build_tool_prompt(tools_payload):
@@ -412,37 +577,69 @@ def build_tool_prompt(tools_payload):
 def extract_skills_block(system_text):
     if not system_text:
         return ""
-    match = re.search(r"<available_skills>(.*?)</available_skills>", system_text, re.DOTALL)
-    if not match:
+    # Two C-level substring scans over the (often ~50KB) OpenClaw prompt; same
+    # result as a non-greedy DOTALL regex for the first complete block.
+    start = system_text.find(_SKILLS_OPEN_TAG)
+    if start == -1:
         return ""
-    block = match.group(1).strip()
+    start += len(_SKILLS_OPEN_TAG)
+    end = system_text.find(_SKILLS_CLOSE_TAG, start)
+    if end == -1:
+        return ""
+    block = system_text[start:end].strip()
     if not block:
         return ""
     return block
 
 
+def _skills_signature():
+    """Cheap fingerprint of the workspace skills: one stat per SKILL.md.
+
+    Editing a SKILL.md doesn't touch the skills directory's own mtime, so the
+    per-file stat is what keeps the cache honest. scandir's d_type lets plain
+    files in the skills dir be skipped without a stat.
+    """
+    try:
+        with os.scandir(WORKSPACE_SKILLS_DIR) as it:
+            entries = sorted(e.name for e in it if e.is_dir())
+    except OSError:
+        return None
+    signature = []
+    for entry in entries:
+        try:
+            st = os.stat(os.path.join(WORKSPACE_SKILLS_DIR, entry, "SKILL.md"))
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            signature.append((entry, st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
 def build_skills_block_from_workspace():
-    if not os.path.isdir(WORKSPACE_SKILLS_DIR):
+    global _SKILLS_CACHE
+    signature = _skills_signature()
+    if signature is None:
         return ""
+    cached_signature, cached_block = _SKILLS_CACHE
+    if signature == cached_signature:
+        return cached_block
     skills = []
-    for entry in sorted(os.listdir(WORKSPACE_SKILLS_DIR)):
-        skill_dir = os.path.join(WORKSPACE_SKILLS_DIR, entry)
-        skill_md = os.path.join(skill_dir, "SKILL.md")
-        if not os.path.isfile(skill_md):
-            continue
+    for entry, _mtime, _size in signature:
+        skill_md = os.path.join(WORKSPACE_SKILLS_DIR, entry, "SKILL.md")
         name = None
         desc = ""
         try:
+            # Only the leading frontmatter matters; stop reading at its
+            # closing delimiter instead of loading the whole file.
             with open(skill_md, "r", encoding="utf-8") as f:
-                lines = f.read().splitlines()
-            if lines and lines[0].strip() == "---":
-                for line in lines[1:]:
-                    if line.strip() == "---":
-                        break
-                    if line.startswith("name:"):
-                        name = line.split(":", 1)[1].strip()
-                    elif line.startswith("description:"):
-                        desc = line.split(":", 1)[1].strip()
+                if f.readline().strip() == "---":
+                    for line in f:
+                        if line.strip() == "---":
+                            break
+                        if line.startswith("name:"):
+                            name = line.split(":", 1)[1].strip()
+                        elif line.startswith("description:"):
+                            desc = line.split(":", 1)[1].strip()
         except Exception:
             continue
         if not name:
@@ -452,18 +649,29 @@ def build_skills_block_from_workspace():
             "description": desc,
             "location": skill_md,
         })
-    if not skills:
-        return ""
-    parts = ["<available_skills>"]
-    for skill in skills:
-        parts.append("  <skill>")
-        parts.append(f"    <name>{skill['name']}</name>")
-        if skill["description"]:
-            parts.append(f"    <description>{skill['description']}</description>")
-        parts.append(f"    <location>{skill['location']}</location>")
-        parts.append("  </skill>")
-    parts.append("</available_skills>")
-    return "\n".join(parts)
+    block = ""
+    if skills:
+        parts = ["<available_skills>"]
+        for skill in skills:
+            parts.append("  <skill>")
+            parts.append(f"    <name>{skill['name']}</name>")
+            if skill["description"]:
+                parts.append(f"    <description>{skill['description']}</description>")
+            parts.append(f"    <location>{skill['location']}</location>")
+            parts.append("  </skill>")
+        parts.append("</available_skills>")
+        block = "\n".join(parts)
+    _SKILLS_CACHE = (signature, block)
+    return block
+
+
+# parse_tool_call fallbacks for model output that isn't clean JSON.
+_JSON_DECODER = json.JSONDecoder()
+_TOOL_NAME_FIELD_RE = re.compile(r'"(?:tool|name|tool_name|skill)"\s*:\s*"([^"]+)"')
+_COMMAND_FIELD_RE = re.compile(r'"command"\s*:\s*"([^"]+)"')
+_FILE_PATH_FIELD_RE = re.compile(r'"(?:file_path|path)"\s*:\s*"([^"]+)"')
+_MESSAGE_FIELD_RE = re.compile(r'"message"\s*:\s*"([^"]+)"')
+_SESSION_KEY_FIELD_RE = re.compile(r'"sessionKey"\s*:\s*"([^"]+)"')
 
 
 def parse_tool_call(content, allowed_names=None):
@@ -476,42 +684,26 @@ def parse_tool_call(content, allowed_names=None):
 
     payload = None
     try:
-        payload = json.loads(raw)
+        payload = _loads(raw)
     except json.JSONDecodeError:
         start = raw.find("{")
         if start != -1:
-            depth = 0
-            end = -1
-            for idx, ch in enumerate(raw[start:], start=start):
-                if ch == "{":
-                    depth += 1
-                elif ch == "}":
-                    depth -= 1
-                    if depth == 0:
-                        end = idx + 1
-                        break
-            if end != -1:
-                candidate = raw[start:end]
-                try:
-                    payload = json.loads(candidate)
-                except json.JSONDecodeError:
-                    return None
-            else:
+            # Let the C decoder find where the first object ends; trailing
+            # prose after it is ignored.
+            try:
+                payload, _end = _JSON_DECODER.raw_decode(raw, start)
+            except json.JSONDecodeError:
                 return None
         else:
-            name_match = re.search(
-                r'"(?:tool|name|tool_name|skill)"\s*:\s*"([^"]+)"', raw
-            )
+            name_match = _TOOL_NAME_FIELD_RE.search(raw)
             if not name_match:
                 return None
             payload = {"tool": name_match.group(1), "arguments": {}}
 
-            command_match = re.search(r'"command"\s*:\s*"([^"]+)"', raw)
-            file_path_match = re.search(
-                r'"(?:file_path|path)"\s*:\s*"([^"]+)"', raw
-            )
-            message_match = re.search(r'"message"\s*:\s*"([^"]+)"', raw)
-            session_key_match = re.search(r'"sessionKey"\s*:\s*"([^"]+)"', raw)
+            command_match = _COMMAND_FIELD_RE.search(raw)
+            file_path_match = _FILE_PATH_FIELD_RE.search(raw)
+            message_match = _MESSAGE_FIELD_RE.search(raw)
+            session_key_match = _SESSION_KEY_FIELD_RE.search(raw)
 
             if command_match:
                 payload["arguments"]["command"] = command_match.group(1)
@@ -528,14 +720,10 @@ def parse_tool_call(content, allowed_names=None):
     if not name:
         return None
     if allowed_names is not None and name not in allowed_names:
-        try:
-            sys.stderr.write(
-                "hailo-sanitize-proxy: forwarding unknown tool name from model: %s\n"
-                % name
-            )
-            sys.stderr.flush()
-        except Exception:
-            pass
+        log.info(
+            "hailo-sanitize-proxy: forwarding unknown tool name from model: %s",
+            name,
+        )
     if not isinstance(args, dict):
         return None
     return {"name": name, "arguments": args}
@@ -546,7 +734,8 @@ def normalize_exec_command(command):
         return ""
     cmd = command.strip()
     if cmd.startswith(". "):
-        cmd = cmd[2:].strip()
+        # Trailing whitespace is already gone; only the gap after "." remains.
+        cmd = cmd.removeprefix(". ").lstrip()
     if cmd.endswith(".py") and not cmd.startswith("python"):
         cmd = f"python3 {cmd}"
     return cmd
@@ -566,13 +755,7 @@ def remap_tool_call(tool_call, latest_user_text, allowed_tool_names):
 
     # Block internal tools the small model can't use correctly
     if name in BLOCKED_TOOL_NAMES:
-        try:
-            sys.stderr.write(
-                "hailo-sanitize-proxy: suppressing blocked tool call: %s\n" % name
-            )
-            sys.stderr.flush()
-        except Exception:
-            pass
+        log.info("hailo-sanitize-proxy: suppressing blocked tool call: %s", name)
         return None
 
     if name == "exec":
@@ -585,24 +768,25 @@ def remap_tool_call(tool_call, latest_user_text, allowed_tool_names):
 
 
 def sanitize_response(
-    data,
+    resp,
     allowed_tool_names=None,
     tool_calls_enabled=True,
     latest_user_text="",
+    now=None,
 ):
-    """Fix hailo-ollama response for OpenAI SDK compatibility."""
-    try:
-        resp = json.loads(data)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        return data
-    if not isinstance(resp, dict):
-        return data
-
-    created = resp.get("created", 0)
-    if isinstance(created, int) and created > 1e15:
-        resp["created"] = int(created // 1000000000)
+    """Fix a parsed hailo-ollama response dict in place for OpenAI SDK compatibility.
+
+    Returns the same dict; serialization is left to the caller so the SSE and
+    completion converters can reuse the parsed object. `now` is the request's
+    timestamp (seconds) used when upstream omits `created`.
+    """
+    # hailo-ollama reports nanoseconds; 10**15 is folded to an int constant,
+    # so this stays an int/int compare with no float coercion.
+    created = resp.get("created") or 0
+    if type(created) is int and created > 10**15:
+        resp["created"] = created // 1000000000
     elif not created:
-        resp["created"] = int(time.time())
+        resp["created"] = now if now is not None else int(time.time())
 
     resp.setdefault("object", "chat.completion")
     resp.setdefault("system_fingerprint", "hailo-ollama")
@@ -632,11 +816,11 @@ def sanitize_response(
                 choice["message"]["content"] = ""
                 choice["message"]["tool_calls"] = [
                     {
-                        "id": f"call_{int(time.time() * 1000)}",
+                        "id": f"{_CALL_ID_PREFIX}{next(_CALL_SEQ)}",
                         "type": "function",
                         "function": {
                             "name": tool_call["name"],
-                            "arguments": json.dumps(tool_call["arguments"]),
+                            "arguments": _dumps_str(tool_call["arguments"]),
                         },
                     }
                 ]
@@ -649,19 +833,29 @@ def sanitize_response(
             "total_tokens": 100 + est_tokens,
         }
 
-    return json.dumps(resp).encode("utf-8")
+    return resp
 
 
-def to_sse(data):
-    """Convert a non-streaming response to SSE format for the OpenAI SDK."""
-    try:
-        resp = json.loads(data)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        return b"data: " + data + b"\n\ndata: [DONE]\n\n"
+_SSE_ROLE_DELTA = b'{"role":"assistant","content":"","refusal":null}'
+_SSE_OPEN_TAIL = b',"logprobs":null,"finish_reason":null}]}\n\n'
+_SSE_FINISH_MID = b'{},"logprobs":null,"finish_reason":"stop"}],"usage":'
+
+
+def iter_sse(resp):
+    """Convert a non-streaming response to SSE frames for the OpenAI SDK.
+
+    Takes the sanitized response dict, or the raw upstream bytes when they
+    were not a JSON object. Yields one `data: ...` frame (bytes) at a time;
+    the caller joins them into a single write.
+    """
+    if not isinstance(resp, dict):
+        yield b"data: " + resp + b"\n\n"
+        yield b"data: [DONE]\n\n"
+        return
 
     cid = resp.get("id", "chatcmpl-0")
     model = resp.get("model", "unknown")
-    created = resp.get("created", int(time.time()))
+    created = resp.get("created") or int(time.time())
     fp = resp.get("system_fingerprint", "hailo-ollama")
     usage = resp.get("usage", {})
     content = ""
@@ -671,48 +865,31 @@ def to_sse(data):
         content = msg.get("content", "")
         tool_calls = msg.get("tool_calls")
 
-    parts = []
+    # Every frame shares the same envelope and differs only in the delta, so
+    # splice pre-serialized byte templates instead of building and dumping a
+    # dict per frame. Key order matches the dict-built frames.
+    head = b"".join((
+        b'data: {"id":', _dumps(cid),
+        b',"object":"chat.completion.chunk","created":', _dumps(created),
+        b',"model":', _dumps(model),
+        b',"system_fingerprint":', _dumps(fp),
+        b',"choices":[{"index":0,"delta":',
+    ))
     # role chunk
-    parts.append("data: %s\n\n" % json.dumps({
-        "id": cid, "object": "chat.completion.chunk", "created": created,
-        "model": model, "system_fingerprint": fp,
-        "choices": [{"index": 0, "delta": {"role": "assistant", "content": "", "refusal": None},
-                     "logprobs": None, "finish_reason": None}],
-    }))
+    yield head + _SSE_ROLE_DELTA + _SSE_OPEN_TAIL
     # tool call chunk
     if tool_calls:
-        parts.append("data: %s\n\n" % json.dumps({
-            "id": cid, "object": "chat.completion.chunk", "created": created,
-            "model": model, "system_fingerprint": fp,
-            "choices": [{"index": 0, "delta": {"tool_calls": tool_calls},
-                         "logprobs": None, "finish_reason": None}],
-        }))
+        yield b"".join((head, b'{"tool_calls":', _dumps(tool_calls), b"}", _SSE_OPEN_TAIL))
     # content chunk
     if content and not tool_calls:
-        parts.append("data: %s\n\n" % json.dumps({
-            "id": cid, "object": "chat.completion.chunk", "created": created,
-            "model": model, "system_fingerprint": fp,
-            "choices": [{"index": 0, "delta": {"content": content},
-                         "logprobs": None, "finish_reason": None}],
-        }))
+        yield b"".join((head, b'{"content":', _dumps(content), b"}", _SSE_OPEN_TAIL))
     # finish chunk
-    parts.append("data: %s\n\n" % json.dumps({
-        "id": cid, "object": "chat.completion.chunk", "created": created,
-        "model": model, "system_fingerprint": fp,
-        "choices": [{"index": 0, "delta": {}, "logprobs": None, "finish_reason": "stop"}],
-        "usage": usage,
-    }))
-    parts.append("data: [DONE]\n\n")
-    return "".join(parts).encode("utf-8")
+    yield b"".join((head, _SSE_FINISH_MID, _dumps(usage), b"}\n\n"))
+    yield b"data: [DONE]\n\n"
 
 
-def convert_chat_to_completion(data):
-    try:
-        resp = json.loads(data)
-    except (json.JSONDecodeError, UnicodeDecodeError):
-        return data
-    if not isinstance(resp, dict):
-        return data
+def convert_chat_to_completion(resp):
+    """Map a parsed chat.completion dict onto a text_completion dict."""
     choice = None
     if resp.get("choices"):
         choice = resp["choices"][0]
@@ -725,7 +902,7 @@ def convert_chat_to_completion(data):
     completion = {
         "id": resp.get("id", "cmpl-0"),
         "object": "text_completion",
-        "created": resp.get("created", int(time.time())),
+        "created": resp.get("created") or int(time.time()),
         "model": resp.get("model", "unknown"),
         "choices": [
             {
@@ -738,27 +915,71 @@ def convert_chat_to_completion(data):
     }
     if "usage" in resp:
         completion["usage"] = resp["usage"]
-    return json.dumps(completion).encode("utf-8")
+    return completion
+
+
+# /api/show only varies in the modelfile line, so the rest of the reply is
+# serialized once at import time.
+_FAKE_SHOW_PREFIX = b'{"modelfile":'
+_FAKE_SHOW_SUFFIX = (
+    b',"parameters":"stop <|im_end|>","template":"{{ .System }}{{ .Prompt }}",'
+    b'"details":{"parent_model":"","format":"gguf","family":"qwen2",'
+    b'"families":["qwen2"],"parameter_size":"1.5B","quantization_level":"Q4_0"},'
+    b'"model_info":{}}'
+)
 
 
 def fake_api_show(body_bytes):
     """Return a fake /api/show response to avoid hailo-ollama's DTO crash."""
-    try:
-        data = json.loads(body_bytes)
-    except Exception:
-        data = {}
+    data = _parse_json_dict(body_bytes) or {}
     model = data.get("name", data.get("model", "qwen2:1.5b"))
-    return json.dumps({
-        "modelfile": "FROM %s" % model,
-        "parameters": "stop <|im_end|>",
-        "template": "{{ .System }}{{ .Prompt }}",
-        "details": {
-            "parent_model": "", "format": "gguf", "family": "qwen2",
-            "families": ["qwen2"], "parameter_size": "1.5B",
-            "quantization_level": "Q4_0",
-        },
-        "model_info": {},
-    }).encode("utf-8")
+    return _FAKE_SHOW_PREFIX + _dumps("FROM %s" % model) + _FAKE_SHOW_SUFFIX
+
+
+def _new_upstream_connection():
+    parts = urllib.parse.urlsplit(UPSTREAM)
+    return http.client.HTTPConnection(
+        parts.hostname, parts.port or 80, timeout=UPSTREAM_TIMEOUT
+    )
+
+
+def upstream_request(method, path, body=None, headers=None, timeout=UPSTREAM_TIMEOUT):
+    """Send a request to upstream over a pooled keep-alive connection.
+
+    Returns (conn, resp); hand both to _release_upstream_connection() once the
+    response body has been consumed. A reused connection that the upstream
+    has already closed is retried once on a fresh socket.
+    """
+    try:
+        conn = _UPSTREAM_IDLE.get_nowait()
+    except queue.Empty:
+        conn = _new_upstream_connection()
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    while True:
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            return conn, conn.getresponse()
+        except (http.client.BadStatusLine, BrokenPipeError, ConnectionResetError):
+            conn.close()
+            if not reused:
+                raise
+        except Exception:
+            conn.close()
+            raise
+
+
+def _release_upstream_connection(conn, resp):
+    """Return conn to the idle pool if resp was fully read, else drop it."""
+    if resp.isclosed():
+        try:
+            _UPSTREAM_IDLE.put_nowait(conn)
+            return
+        except queue.Full:
+            pass
+    conn.close()
 
 
 def _unique_model_ids(values):
@@ -778,14 +999,15 @@ def _unique_model_ids(values):
 
 
 def discover_upstream_model_ids():
-    """Discover models from upstream `/api/tags` with local fallback."""
-    tags_url = "%s/api/tags" % UPSTREAM
+    """Discover models from upstream `/api/tags`; [] if none could be found."""
     discovered = []
 
     try:
-        req = urllib.request.Request(tags_url, method="GET")
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            payload = json.loads(resp.read())
+        conn, resp = upstream_request("GET", "/api/tags", timeout=8)
+        try:
+            payload = _loads(resp.read()) if resp.status == 200 else None
+        finally:
+            _release_upstream_connection(conn, resp)
     except Exception:
         payload = None
 
@@ -810,39 +1032,68 @@ def discover_upstream_model_ids():
                 if isinstance(name, str):
                     discovered.append(name)
 
-    models = _unique_model_ids(discovered)
-    if not models:
-        models = [DEFAULT_MODEL_ID]
-    return models
+    return _unique_model_ids(discovered)
+
+
+# Served when upstream lists no models (e.g. hailo-ollama still starting):
+# a constant, so the fallback costs no encode. `created` is the proxy start.
+_FALLBACK_V1_MODELS_BODY = _dumps({
+    "object": "list",
+    "data": [{
+        "id": DEFAULT_MODEL_ID,
+        "object": "model",
+        "created": int(time.time()),
+        "owned_by": "hailo-ollama",
+    }],
+})
 
 
 def fake_v1_models_list():
-    now = int(time.time())
-    models = [
-        {
-            "id": model_id,
-            "object": "model",
-            "created": now,
-            "owned_by": "hailo-ollama",
-        }
-        for model_id in discover_upstream_model_ids()
-    ]
-    return json.dumps({"object": "list", "data": models}).encode("utf-8")
+    global _MODELS_CACHE
+    expires_at, cached_body = _MODELS_CACHE
+    mono = time.monotonic()
+    if cached_body is not None and mono < expires_at:
+        return cached_body
+    model_ids = discover_upstream_model_ids()
+    if model_ids:
+        now = int(time.time())
+        models = [
+            {
+                "id": model_id,
+                "object": "model",
+                "created": now,
+                "owned_by": "hailo-ollama",
+            }
+            for model_id in model_ids
+        ]
+        body = _dumps({"object": "list", "data": models})
+    else:
+        body = _FALLBACK_V1_MODELS_BODY
+    _MODELS_CACHE = (mono + MODELS_CACHE_TTL, body)
+    return body
 
 
 def fake_v1_model(model_id):
     now = int(time.time())
-    return json.dumps(
+    return _dumps(
         {
             "id": model_id,
             "object": "model",
             "created": now,
             "owned_by": "hailo-ollama",
         }
-    ).encode("utf-8")
+    )
 
 
 class ProxyHandler(http.server.BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps client connections open between requests; every
+    # response is either Content-Length/chunked framed or closes the socket.
+    protocol_version = "HTTP/1.1"
+    # Responses are written in one go, so Nagle only delays the last segment.
+    disable_nagle_algorithm = True
+    # Idle keep-alive connections give their thread back after this long.
+    timeout = 60
+
     def do_GET(self):
         self._proxy("GET")
 
@@ -852,25 +1103,60 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
     def do_OPTIONS(self):
         trace_id = _next_trace_id()
         started = time.time()
-        path = self.path.rstrip("/")
+        path = self._request_path()
         if not self._validate_request_security(trace_id, "OPTIONS", path, started):
             return
         self.send_response(204)
         self.send_header("Content-Length", "0")
         self.end_headers()
-        sys.stderr.write(
-            "hailo-sanitize-proxy[%s]: OPTIONS %s -> 204 preflight duration_ms=%d\n"
-            % (trace_id, path, int((time.time() - started) * 1000))
+        log.info(
+            "hailo-sanitize-proxy[%s]: OPTIONS %s -> 204 preflight duration_ms=%d",
+            trace_id, path, int((time.time() - started) * 1000),
         )
-        sys.stderr.flush()
 
+    def _read_body(self, length):
+        """Read exactly Content-Length bytes into one pre-sized buffer.
+
+        orjson and json both parse a bytearray directly, so the body is never
+        copied into an intermediate bytes object.
+        """
+        if length <= 0:
+            return b""
+        body = bytearray(length)
+        view = memoryview(body)
+        got = 0
+        while got < length:
+            n = self.rfile.readinto(view[got:])
+            if not n:
+                break
+            got += n
+        view.release()
+        if got < length:
+            del body[got:]
+        return body
+
+    def _request_path(self):
+        """Route key for self.path: query string dropped, trailing slash trimmed."""
+        return urllib.parse.urlsplit(self.path).path.rstrip("/")
+
+    # Allowed values are stored normalized, so a header that is already a
+    # member is returned as-is, skipping the strip()/lower() copies for the
+    # usual case of a known local client.
     def _origin_header(self):
         origin = self.headers.get("Origin")
-        return origin.strip() if origin else ""
+        if not origin:
+            return ""
+        if origin in CORS_ALLOWED_ORIGINS:
+            return origin
+        return origin.strip()
 
     def _host_header(self):
         host = self.headers.get("Host")
-        return host.strip().lower() if host else ""
+        if not host:
+            return ""
+        if host in ALLOWED_HOSTS:
+            return host
+        return host.strip().lower()
 
     def _is_origin_allowed(self, origin):
         if not origin:
@@ -883,13 +1169,14 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
         return host in ALLOWED_HOSTS
 
     def _deny_request(self, trace_id, method, path, started, reason, details):
-        payload = json.dumps({"error": reason, "details": details}).encode("utf-8")
+        # The request body is left unread, so the connection can't be reused.
+        self.close_connection = True
+        payload = _DENY_BODY_PREFIXES[reason] + _dumps(details) + b"}"
         self._send_json(403, payload)
-        sys.stderr.write(
-            "hailo-sanitize-proxy[%s]: %s %s -> 403 denied reason=%s details=%s duration_ms=%d\n"
-            % (trace_id, method, path, reason, details, int((time.time() - started) * 1000))
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> 403 denied reason=%s details=%s duration_ms=%d",
+            trace_id, method, path, reason, details, int((time.time() - started) * 1000),
         )
-        sys.stderr.flush()
 
     def _validate_request_security(self, trace_id, method, path, started):
         host = self._host_header()
@@ -906,15 +1193,11 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
 
     def _send_cors_headers(self):
         origin = self._origin_header()
-        if not origin:
+        if not origin or origin not in CORS_ALLOWED_ORIGINS:
             return
-        if origin not in CORS_ALLOWED_ORIGINS:
-            return
-        self.send_header("Vary", "Origin")
         self.send_header("Access-Control-Allow-Origin", origin)
-        self.send_header("Access-Control-Allow-Methods", CORS_ALLOW_METHODS)
-        self.send_header("Access-Control-Allow-Headers", CORS_ALLOW_HEADERS)
-        self.send_header("Access-Control-Max-Age", "86400")
+        for keyword, value in CORS_STATIC_HEADERS:
+            self.send_header(keyword, value)
 
     def end_headers(self):
         self._send_cors_headers()
@@ -923,234 +1206,328 @@ class ProxyHandler(http.server.BaseHTTPRequestHandler):
     def _proxy(self, method):
         trace_id = _next_trace_id()
         started = time.time()
-        path = self.path.rstrip("/")
+        path = self._request_path()
         if not self._validate_request_security(trace_id, method, path, started):
             return
-        length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(length) if length else b""
-        allowed_tool_names = _extract_tool_names(body) if body else set()
-        latest_user_text = _extract_latest_user_text(body) if body else ""
+        if "Transfer-Encoding" in self.headers:
+            # Chunked request bodies aren't decoded; don't parse the rest of
+            # the stream as a new request.
+            self.close_connection = True
+        body = self._read_body(int(self.headers.get("Content-Length", 0)))
+        # Parse the client body once; everything below works on this dict.
+        parsed = _parse_json_dict(body) if body else None
+        allowed_tool_names = _extract_tool_names(parsed)
+        latest_user_text = _extract_latest_user_text(parsed)
         allow_tool_calls = _has_explicit_tool_intent(latest_user_text)
 
         _write_trace(trace_id, "client-request.raw", body)
-        sys.stderr.write(
-            "hailo-sanitize-proxy[%s]: IN %s %s bytes=%d summary=%s\n"
-            % (trace_id, method, path, len(body), _summarize_request_body(body))
+        log.info(
+            "hailo-sanitize-proxy[%s]: IN %s %s bytes=%d summary=%s",
+            trace_id, method, path, len(body), _summarize_request_body(parsed, len(body)),
         )
         if body:
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: TOOL_INTENT enabled=%s latest_user=%s\n"
-                % (trace_id, allow_tool_calls, _json_preview(latest_user_text, 180))
-            )
-        sys.stderr.flush()
-
-        # Fake /api/show
-        if path == "/api/show" and method == "POST":
-            resp_body = fake_api_show(body)
-            _write_trace(trace_id, "proxy-response.fake-api-show", resp_body)
-            self._send_json(200, resp_body)
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> 200 faked duration_ms=%d\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000))
-            )
-            sys.stderr.flush()
-            return
-
-        # OpenAI-compatible model discovery for clients (Nanobot, Moltis, etc.)
-        if path == "/v1/models" and method == "GET":
-            resp_body = fake_v1_models_list()
-            _write_trace(trace_id, "proxy-response.fake-v1-models", resp_body)
-            self._send_json(200, resp_body)
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> 200 faked model list duration_ms=%d\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000))
+            log.info(
+                "hailo-sanitize-proxy[%s]: TOOL_INTENT enabled=%s latest_user=%s",
+                trace_id, allow_tool_calls, _json_preview(latest_user_text, 180),
             )
-            sys.stderr.flush()
-            return
 
-        if path.startswith("/v1/models/") and method == "GET":
-            model_id = path.split("/v1/models/", 1)[1].strip()
-            if not model_id:
-                self._send_json(404, b'{"error":"model not found"}')
-                return
-            resp_body = fake_v1_model(model_id)
-            _write_trace(trace_id, "proxy-response.fake-v1-model", resp_body)
-            self._send_json(200, resp_body)
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> 200 faked model detail duration_ms=%d\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000))
-            )
-            sys.stderr.flush()
+        handler = self._ROUTES.get((method, path))
+        if handler is None and method == "GET" and path.startswith("/v1/models/"):
+            handler = ProxyHandler._handle_v1_model
+        if handler is not None:
+            handler(self, trace_id, method, path, started, body)
             return
 
         # Detect streaming + sanitize for chat completions
         client_wants_stream = False
-        is_chat = path == "/v1/chat/completions" and method == "POST"
-        is_completion = path == "/v1/completions" and method == "POST"
+        is_chat = method == "POST" and path == "/v1/chat/completions"
+        is_completion = method == "POST" and path == "/v1/completions"
         original_body = body
-        if is_completion and body:
-            try:
-                payload = json.loads(body)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                payload = None
-            if isinstance(payload, dict):
-                prompt = payload.get("prompt", "")
-                model = payload.get("model")
-                chat_payload = {
-                    "model": model,
-                    "messages": [{"role": "user", "content": prompt or ""}],
-                    "temperature": payload.get("temperature"),
-                    "top_p": payload.get("top_p"),
-                    "max_tokens": payload.get("max_tokens"),
-                    "stream": False,
-                }
-                body = json.dumps(chat_payload).encode("utf-8")
-                is_chat = True
-        if is_chat and body:
-            try:
-                client_wants_stream = json.loads(body).get("stream", False)
-            except Exception:
-                pass
-            body = sanitize_chat_body(body, tool_prompt_enabled=allow_tool_calls)
+        upstream_payload = parsed
+        if is_completion and parsed is not None:
+            chat_payload = {
+                "model": parsed.get("model"),
+                "messages": [{"role": "user", "content": parsed.get("prompt", "") or ""}],
+                "temperature": parsed.get("temperature"),
+                "top_p": parsed.get("top_p"),
+                "max_tokens": parsed.get("max_tokens"),
+                "stream": False,
+            }
+            upstream_payload, client_wants_stream = sanitize_chat_dict(
+                chat_payload, tool_prompt_enabled=allow_tool_calls
+            )
+            body = _dumps(upstream_payload)
+            is_chat = True
+        elif is_chat and parsed is not None:
+            upstream_payload, client_wants_stream = sanitize_chat_dict(
+                parsed, tool_prompt_enabled=allow_tool_calls
+            )
+            # Already in upstream shape (e.g. re-proxied traffic): forward the
+            # original bytes instead of re-serializing. Dict equality bails out
+            # on the first size/key mismatch, so this is near-free otherwise.
+            if upstream_payload != parsed:
+                body = _dumps(upstream_payload)
 
         upstream_path = "/v1/chat/completions" if is_completion else self.path
 
         _write_trace(trace_id, "upstream-request.body", body)
-        sys.stderr.write(
-            "hailo-sanitize-proxy[%s]: UPSTREAM %s %s body_bytes=%d summary=%s\n"
-            % (trace_id, method, upstream_path, len(body), _summarize_request_body(body))
+        log.info(
+            "hailo-sanitize-proxy[%s]: UPSTREAM %s %s body_bytes=%d summary=%s",
+            trace_id, method, upstream_path, len(body), _summarize_request_body(upstream_payload, len(body)),
         )
-        sys.stderr.flush()
-
-        url = "%s%s" % (UPSTREAM, upstream_path)
-        req = urllib.request.Request(url, data=body if body else None, method=method)
-        for header in self.headers:
-            lower = header.lower()
-            if lower not in (
-                "host",
-                "content-length",
-                "transfer-encoding",
-                "origin",
-                "access-control-request-method",
-                "access-control-request-headers",
-            ):
-                req.add_header(header, self.headers[header])
+
+        forward_headers = {}
+        for header, value in self.headers.items():
+            if header.lower() not in FORWARD_SKIP_REQUEST_HEADERS:
+                forward_headers[header] = value
         if body:
-            req.add_header("Content-Length", str(len(body)))
+            forward_headers["Content-Length"] = str(len(body))
 
         try:
             upstream_started = time.time()
-            resp = urllib.request.urlopen(req, timeout=UPSTREAM_TIMEOUT)
-            data = resp.read()
+            conn, resp = upstream_request(method, upstream_path, body or None, forward_headers)
+            try:
+                if resp.status >= 400:
+                    self._send_upstream_error(
+                        trace_id, method, path, resp, started, is_chat, original_body, body
+                    )
+                    return
+                if not is_chat and not is_completion:
+                    self._relay_upstream_response(
+                        trace_id, method, path, upstream_path, resp, started, upstream_started
+                    )
+                    return
+                data = resp.read()
+            finally:
+                _release_upstream_connection(conn, resp)
             _write_trace(trace_id, "upstream-response.raw", data)
 
+            # Parse once and hand the dict through sanitize -> SSE/completion;
+            # it is only serialized again at the edge.
+            result = _parse_json_dict(data)
             upstream_ms = int((time.time() - upstream_started) * 1000)
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: UPSTREAM-RESP %s %s status=%d duration_ms=%d bytes=%d summary=%s\n"
-                % (trace_id, method, upstream_path, resp.status, upstream_ms, len(data), _summarize_response_body(data))
+            log.info(
+                "hailo-sanitize-proxy[%s]: UPSTREAM-RESP %s %s status=%d duration_ms=%d bytes=%d summary=%s",
+                trace_id, method, upstream_path, resp.status, upstream_ms, len(data),
+                _summarize_response_body(result, len(data)),
             )
-            sys.stderr.flush()
-
-            if is_chat:
-                data = sanitize_response(
-                    data,
-                    allowed_tool_names=allowed_tool_names,
-                    tool_calls_enabled=allow_tool_calls,
-                    latest_user_text=latest_user_text,
-                )
-            if is_completion:
-                data = convert_chat_to_completion(data)
-
+            if result is not None:
+                if is_chat:
+                    result = sanitize_response(
+                        result,
+                        allowed_tool_names=allowed_tool_names,
+                        tool_calls_enabled=allow_tool_calls,
+                        latest_user_text=latest_user_text,
+                        now=int(started),
+                    )
+                if is_completion:
+                    result = convert_chat_to_completion(result)
+
+            as_sse = is_chat and client_wants_stream and not is_completion
+            if result is not None and (TRACE_ENABLED or not as_sse):
+                data = _dumps(result)
             _write_trace(trace_id, "proxy-response.final", data)
 
-            if is_chat and client_wants_stream and not is_completion:
-                sse_data = to_sse(data)
+            if as_sse:
+                sse_data = b"".join(iter_sse(result if result is not None else data))
                 _write_trace(trace_id, "proxy-response.sse", sse_data)
-                self.send_response(200)
-                self.send_header("Content-Type", "text/event-stream")
-                self.send_header("Cache-Control", "no-cache")
-                self.send_header("Connection", "close")
-                self.send_header("Content-Length", str(len(sse_data)))
-                self.end_headers()
-                self.wfile.write(sse_data)
-                self.wfile.flush()
-                sys.stderr.write(
-                    "hailo-sanitize-proxy[%s]: %s %s -> %d SSE (%d bytes) duration_ms=%d\n"
-                    % (trace_id, method, path, resp.status, len(sse_data), int((time.time() - started) * 1000))
+                self._send_sse(200, sse_data)
+                log.info(
+                    "hailo-sanitize-proxy[%s]: %s %s -> %d SSE (%d bytes) duration_ms=%d",
+                    trace_id, method, path, resp.status, len(sse_data), int((time.time() - started) * 1000),
                 )
             else:
                 self._send_json(resp.status, data)
-                sys.stderr.write(
-                    "hailo-sanitize-proxy[%s]: %s %s -> %d (%d bytes) duration_ms=%d\n"
-                    % (trace_id, method, path, resp.status, len(data), int((time.time() - started) * 1000))
+                log.info(
+                    "hailo-sanitize-proxy[%s]: %s %s -> %d (%d bytes) duration_ms=%d",
+                    trace_id, method, path, resp.status, len(data), int((time.time() - started) * 1000),
                 )
-            sys.stderr.flush()
-        except urllib.error.HTTPError as e:
-            err_data = e.read()
-            _write_trace(trace_id, "upstream-response.error", err_data)
-            if is_chat and e.code == 500:
-                try:
-                    ts = int(time.time())
-                    with open(f"/tmp/hailo-proxy-500-raw-{ts}.json", "wb") as f:
-                        f.write(original_body or b"")
-                    with open(f"/tmp/hailo-proxy-500-sanitized-{ts}.json", "wb") as f:
-                        f.write(body or b"")
-                except Exception:
-                    pass
-            self.send_response(e.code)
-            for h, v in e.headers.items():
-                if h.lower() not in ("transfer-encoding",):
-                    self.send_header(h, v)
-            self.end_headers()
-            self.wfile.write(err_data)
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> %d ERROR duration_ms=%d summary=%s\n"
-                % (trace_id, method, path, e.code, int((time.time() - started) * 1000), _summarize_response_body(err_data))
-            )
-            sys.stderr.flush()
         except TimeoutError:
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> 504 TIMEOUT after_ms=%d\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000))
+            self.close_connection = True
+            log.info(
+                "hailo-sanitize-proxy[%s]: %s %s -> 504 TIMEOUT after_ms=%d",
+                trace_id, method, path, int((time.time() - started) * 1000),
             )
-            sys.stderr.flush()
             try:
                 self._send_json(504, b'{"error":"upstream timeout"}')
             except BrokenPipeError:
                 pass
         except BrokenPipeError:
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> client disconnected (broken pipe) after_ms=%d\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000))
+            log.info(
+                "hailo-sanitize-proxy[%s]: %s %s -> client disconnected (broken pipe) after_ms=%d",
+                trace_id, method, path, int((time.time() - started) * 1000),
             )
-            sys.stderr.flush()
         except Exception as e:
+            # A response may already be partly written; don't reuse the socket.
+            self.close_connection = True
             try:
                 msg = ("Proxy error: %s" % e).encode("utf-8")
                 self._send_json(502, msg)
             except BrokenPipeError:
                 pass
-            sys.stderr.write(
-                "hailo-sanitize-proxy[%s]: %s %s -> 502 EXCEPTION after_ms=%d: %s\n"
-                % (trace_id, method, path, int((time.time() - started) * 1000), e)
+            log.info(
+                "hailo-sanitize-proxy[%s]: %s %s -> 502 EXCEPTION after_ms=%d: %s",
+                trace_id, method, path, int((time.time() - started) * 1000), e,
             )
-            sys.stderr.flush()
+
+    def _handle_api_show(self, trace_id, method, path, started, body):
+        # Fake /api/show
+        resp_body = fake_api_show(body)
+        _write_trace(trace_id, "proxy-response.fake-api-show", resp_body)
+        self._send_json(200, resp_body)
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> 200 faked duration_ms=%d",
+            trace_id, method, path, int((time.time() - started) * 1000),
+        )
+
+    def _handle_v1_models(self, trace_id, method, path, started, body):
+        # OpenAI-compatible model discovery for clients (Nanobot, Moltis, etc.)
+        resp_body = fake_v1_models_list()
+        _write_trace(trace_id, "proxy-response.fake-v1-models", resp_body)
+        self._send_json(200, resp_body)
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> 200 faked model list duration_ms=%d",
+            trace_id, method, path, int((time.time() - started) * 1000),
+        )
+
+    def _handle_v1_model(self, trace_id, method, path, started, body):
+        model_id = path.split("/v1/models/", 1)[1].strip()
+        if not model_id:
+            self._send_json(404, b'{"error":"model not found"}')
+            return
+        resp_body = fake_v1_model(model_id)
+        _write_trace(trace_id, "proxy-response.fake-v1-model", resp_body)
+        self._send_json(200, resp_body)
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> 200 faked model detail duration_ms=%d",
+            trace_id, method, path, int((time.time() - started) * 1000),
+        )
+
+    def _send_upstream_error(self, trace_id, method, path, resp, started, is_chat, original_body, body):
+        err_data = resp.read()
+        _write_trace(trace_id, "upstream-response.error", err_data)
+        if is_chat and resp.status == 500:
+            _submit_background(_dump_500_bodies, int(started), original_body, body)
+        self.send_response(resp.status)
+        for h, v in resp.headers.items():
+            lower = h.lower()
+            if lower not in RELAY_SKIP_RESPONSE_HEADERS and lower != "content-length":
+                self.send_header(h, v)
+        self.send_header("Content-Length", str(len(err_data)))
+        self._send_close_header()
+        self.end_headers()
+        self.wfile.write(err_data)
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> %d ERROR duration_ms=%d summary=%s",
+            trace_id, method, path, resp.status, int((time.time() - started) * 1000), _summarize_response_body(_parse_json_dict(err_data), len(err_data)),
+        )
+
+    def _relay_upstream_response(self, trace_id, method, path, upstream_path, resp, started, upstream_started):
+        """Pipe a passthrough response to the client as it arrives instead of buffering it.
+
+        read1() returns whatever upstream has sent so far (up to
+        RELAY_CHUNK_BYTES) rather than waiting for a full buffer, so
+        streamed NDJSON from /api/generate and /api/chat reaches the client
+        line by line.
+        """
+        self.send_response(resp.status)
+        for h, v in resp.headers.items():
+            if h.lower() not in RELAY_SKIP_RESPONSE_HEADERS:
+                self.send_header(h, v)
+        if resp.getheader("Content-Length") is None:
+            # Upstream sent it chunked; relay it close-delimited instead.
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        total = 0
+        head = bytearray()
+        while True:
+            chunk = resp.read1(RELAY_CHUNK_BYTES)
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            total += len(chunk)
+            if TRACE_ENABLED and len(head) < TRACE_MAX_BYTES:
+                head += chunk[:TRACE_MAX_BYTES - len(head)]
+        _write_trace(trace_id, "upstream-response.raw", bytes(head))
+        log.info(
+            "hailo-sanitize-proxy[%s]: UPSTREAM-RESP %s %s status=%d duration_ms=%d bytes=%d streamed",
+            trace_id, method, upstream_path, resp.status, int((time.time() - upstream_started) * 1000), total,
+        )
+        log.info(
+            "hailo-sanitize-proxy[%s]: %s %s -> %d (%d bytes) duration_ms=%d",
+            trace_id, method, path, resp.status, total, int((time.time() - started) * 1000),
+        )
+
+    def _send_sse(self, code, data):
+        """Write an already-complete SSE payload in one write.
+
+        The upstream response is fully buffered before conversion, so every
+        frame is ready up front; coalescing them avoids a send per frame,
+        and the known length lets the connection stay open for keep-alive.
+        """
+        self.send_response(code)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(data)))
+        self._send_close_header()
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_close_header(self):
+        # close_connection alone is invisible to a keep-alive client; without
+        # the header its next request on this socket hits a dead connection.
+        if self.close_connection:
+            self.send_header("Connection", "close")
 
     def _send_json(self, code, data):
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
         self.send_header("Content-Length", str(len(data)))
+        self._send_close_header()
         self.end_headers()
         self.wfile.write(data)
 
     def log_message(self, format, *args):
         pass
 
+    # (method, path) -> handler for endpoints answered locally. The
+    # /v1/models/<id> prefix is matched separately in _proxy().
+    _ROUTES = {
+        ("POST", "/api/show"): _handle_api_show,
+        ("GET", "/v1/models"): _handle_v1_models,
+    }
+
+
+class ProxyServer(http.server.ThreadingHTTPServer):
+    """One thread per client connection; upstream sockets come from the shared pool."""
+
+    daemon_threads = True
+    # socketserver's default listen backlog is 5, which a burst of OpenClaw
+    # probes (/v1/models, /api/show, chat) can overflow.
+    request_queue_size = 64
+
+
+def _configure_logging():
+    """Hand log records to a listener thread so handlers never block on stderr."""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stderr))
+    # QueueHandler formats the record in the caller; the stream handler then
+    # writes that finished message as-is.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[logging.handlers.QueueHandler(log_queue)],
+    )
+    listener.start()
+    return listener
+
 
 def main():
+    log_listener = _configure_logging()
     _ensure_trace_dir()
-    server = http.server.ThreadingHTTPServer(("127.0.0.1", LISTEN_PORT), ProxyHandler)
-    server.daemon_threads = True
+    server = ProxyServer(("127.0.0.1", LISTEN_PORT), ProxyHandler)
     print(
         "hailo-sanitize-proxy: listening on 127.0.0.1:%d -> %s"
         % (LISTEN_PORT, UPSTREAM),
@@ -1161,6 +1538,7 @@ def main():
     except KeyboardInterrupt:
         pass
     server.server_close()
+    log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -1044,6 +1044,11 @@ EOF
             print_error "hailo-sanitize-proxy.py not found alongside installer"
             print_warn "Expected at: $PROXY_SRC"
         else
+            # Optional: orjson speeds up the proxy's JSON hot path (stdlib fallback otherwise)
+            if [[ "$OFFLINE_MODE" != "true" ]]; then
+                sudo apt install -y python3-orjson || print_warn "python3-orjson not installed; proxy will use stdlib json"
+            fi
+
             sudo cp "$PROXY_SRC" /usr/local/bin/hailo-sanitize-proxy.py
             sudo chmod +x /usr/local/bin/hailo-sanitize-proxy.py
             
@@ -1969,6 +1974,11 @@ phase8_rag_setup() {
         chmod +x "$RAG_INSTALL_DIR/test_rag.py"
         print_step "RAG test script installed"
     fi
+    if [[ -f "$SCRIPT_DIR/rag/rag_daemon.py" ]]; then
+        cp "$SCRIPT_DIR/rag/rag_daemon.py" "$RAG_INSTALL_DIR/"
+        chmod +x "$RAG_INSTALL_DIR/rag_daemon.py"
+        print_step "RAG daemon script installed"
+    fi
     
     deactivate
     
@@ -2031,6 +2041,7 @@ HAILO_MODEL=$HAILO_MODEL
 RAG_DATA_DIR=$RAG_DOCS_DIR_ENV
 EMBEDDINGS_PROVIDER=local
 EMBEDDINGS_MODEL=sentence-transformers/all-MiniLM-L6-v2
+EMBEDDINGS_BACKEND=onnx
 LLM_PROVIDER=openai
 OPENAI_API_BASE=http://127.0.0.1:8081/v1
 OPENAI_API_KEY=hailo-local
@@ -2054,6 +2065,36 @@ fi
 deactivate
 EOF
     chmod +x "$HOME/.openclaw/rag_query.sh"
+
+    # Keep a warm RAGEngine resident; rag_query.py uses its socket when live
+    if [[ -f "$RAG_INSTALL_DIR/rag_daemon.py" ]]; then
+        sudo tee /etc/systemd/system/openclaw-rag.service > /dev/null << EOF
+[Unit]
+Description=OpenClaw RAG query daemon
+After=network.target
+
+[Service]
+Type=simple
+User=$USER
+WorkingDirectory=$RAG_INSTALL_DIR
+EnvironmentFile=$RAG_INSTALL_DIR/.env
+ExecStart=$RAG_INSTALL_DIR/venv/bin/python3 $RAG_INSTALL_DIR/rag_daemon.py
+Restart=on-failure
+RestartSec=5
+
+[Install]
+WantedBy=multi-user.target
+EOF
+        sudo systemctl daemon-reload
+        # The daemon exits when there is nothing to index; only start it with docs
+        if [[ -n "$(find "$RAG_DOCS_DIR_ENV" -type f -not -path '*/.*' -print -quit 2>/dev/null)" ]]; then
+            sudo systemctl enable openclaw-rag.service
+            sudo systemctl restart openclaw-rag.service || print_warn "RAG daemon did not start — check: journalctl -u openclaw-rag"
+        else
+            print_warn "No documents in $RAG_DOCS_DIR_ENV — RAG daemon not started"
+            echo "  Add documents, then: sudo systemctl enable --now openclaw-rag"
+        fi
+    fi
     
     print_step "RAG setup complete"
     echo ""
@@ -2061,6 +2102,7 @@ EOF
     echo "  Query RAG:       ~/.openclaw/rag_query.sh \"your question\""
     echo "  Interactive:     ~/.openclaw/rag_query.sh --interactive"
     echo "  Run smoke tests: ~/.openclaw/rag_query.sh --test"
+    echo "  Changed documents are picked up on the next query (daemon reloads its index)"
     echo "  Documents dir:   $RAG_DOCS_DIR"
 }
 
@@ -1,30 +1,83 @@
 #!/usr/bin/env python3
+import http.client
 import json
 import os
-import subprocess
+import threading
 import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: python3-orjson; stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(value):
+        return json.dumps(value).encode("utf-8")
+
 CONFIG_FILE = os.path.expanduser("~/.config/moltbook/credentials.json")
 STATE_FILE = os.path.expanduser("~/.config/moltbook/heartbeat_state.json")
+API_HOST = "www.moltbook.com"
+API_TIMEOUT = 30  # seconds
+
+# One kept-alive HTTPS connection per thread for the calls in this run, so
+# the TLS handshake is paid once per thread instead of once per curl process.
+# http.client connections can't be shared between threads.
+_LOCAL = threading.local()
 
 def load_config():
     with open(CONFIG_FILE, 'r') as f:
         return json.load(f)
 
-def run_curl(url, api_key, method="GET", data=None):
-    cmd = ["curl", "-s", url, "-H", f"Authorization: Bearer {api_key}"]
+def get_connection():
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is None:
+        conn = _LOCAL.conn = http.client.HTTPSConnection(API_HOST, timeout=API_TIMEOUT)
+    return conn
+
+# What a server closing an idle kept-alive socket looks like; only these are
+# worth one retry. Timeouts and other errors surface to the caller.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+def _send(conn, method, path, body, headers):
+    try:
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse().read()
+    except Exception:
+        # Don't leave a half-finished exchange on this thread's connection;
+        # request() reopens it after close().
+        conn.close()
+        raise
+
+def api_request(url, api_key, method="GET", data=None):
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme != "https" or parts.netloc != API_HOST:
+        raise ValueError(f"api_request only talks to https://{API_HOST}, got {url}")
+    path = parts.path + ("?" + parts.query if parts.query else "")
+    headers = {"Authorization": f"Bearer {api_key}"}
+    body = None
     if method == "POST":
-        cmd.extend(["-X", "POST"])
-        cmd.extend(["-H", "Content-Type: application/json"])
+        headers["Content-Type"] = "application/json"
         if data:
-            cmd.extend(["-d", json.dumps(data)])
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
+            body = _dumps(data)
+
+    conn = get_connection()
+    try:
+        raw = _send(conn, method, path, body, headers)
+    except _STALE_CONNECTION_ERRORS:
+        raw = _send(conn, method, path, body, headers)
     try:
-        return json.loads(result.stdout)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return _loads(raw)
     except json.JSONDecodeError:
-        return result.stdout
+        return raw.decode("utf-8", errors="replace")
 
 def check_moltbook():
     print(f"[{datetime.now()}] Checking Moltbook...")
@@ -33,21 +86,26 @@ def check_moltbook():
     
     # 1. Check Status
     print("Checking status...")
-    status = run_curl("https://www.moltbook.com/api/v1/agents/status", api_key)
+    status = api_request("https://www.moltbook.com/api/v1/agents/status", api_key)
     print(f"Status: {status.get('status')}")
     
     if status.get("status") != "claimed":
         print("Agent is not claimed yet!")
         return
 
-    # 2. Check DMs
+    # 2 + 3. DMs and feed are independent: fetch the feed on a worker thread
+    # while the DM check reuses this thread's open connection.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        feed_future = pool.submit(
+            api_request, "https://www.moltbook.com/api/v1/posts?sort=new&limit=5", api_key
+        )
+        dms = api_request("https://www.moltbook.com/api/v1/agents/dm/check", api_key)
+        feed = feed_future.result()
+
     print("\nChecking DMs...")
-    dms = run_curl("https://www.moltbook.com/api/v1/agents/dm/check", api_key)
     print(f"DMs: {json.dumps(dms, indent=2)}")
     
-    # 3. Check Feed
     print("\nChecking Feed (Global New)...")
-    feed = run_curl("https://www.moltbook.com/api/v1/posts?sort=new&limit=5", api_key)
     if isinstance(feed, dict) and "posts" in feed:
         for post in feed["posts"]:
             print(f"- [{post.get('id')}] {post.get('author', {}).get('name')}: {post.get('title')}")
@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
+import http.client
 import json
 import os
-import subprocess
 import argparse
 import sys
 
+try:
+    import orjson
+except ImportError:  # optional: python3-orjson; stdlib json is the fallback
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(value):
+        return json.dumps(value).encode("utf-8")
+
 CONFIG_FILE = os.path.expanduser("~/.config/moltbook/credentials.json")
+API_HOST = "www.moltbook.com"
+API_TIMEOUT = 30  # seconds
 
 def load_config():
     if not os.path.exists(CONFIG_FILE):
@@ -56,26 +72,36 @@ def post_to_moltbook(title, content, submolt, dry_run=False):
 
     # print(f"Posting to '{submolt}' with title '{title}'...")
     
-    cmd = [
-        "curl", "-s", "-X", "POST", "https://www.moltbook.com/api/v1/posts",
-        "-H", f"Authorization: Bearer {api_key}",
-        "-H", "Content-Type: application/json",
-        "-d", json.dumps(payload)
-    ]
-    
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    
+    # Post in-process rather than spawning curl for a single request.
+    try:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=API_TIMEOUT)
+        try:
+            conn.request(
+                "POST", "/api/v1/posts",
+                body=_dumps(payload),
+                headers={
+                    "Authorization": f"Bearer {api_key}",
+                    "Content-Type": "application/json",
+                },
+            )
+            raw = conn.getresponse().read()
+        finally:
+            conn.close()
+    except (http.client.HTTPException, OSError) as e:
+        print(f"Error: Request failed: {e}")
+        return
+
     try:
-        response = json.loads(result.stdout)
+        response = _loads(raw)
         if response.get("success"):
             print(f"Success! Post ID: {response.get('post', {}).get('id')}")
             print(f"URL: https://moltbook.com/p/{response.get('post', {}).get('id')}")
         else:
             print(f"Failed to post: {response.get('error')}")
-            # print(f"Full response: {result.stdout}")
+            # print(f"Full response: {raw!r}")
     except json.JSONDecodeError:
         print("Error: Could not parse server response")
-        print(result.stdout)
+        print(raw.decode("utf-8", errors="replace"))
 
 def main():
     parser = argparse.ArgumentParser(description="Post to Moltbook from file, argument, or stdin")
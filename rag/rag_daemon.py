@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Long-running RAG daemon for OpenClaw on Raspberry Pi.
+
+Builds one RAGEngine (models + index) at startup and answers queries over a
+Unix socket, so rag_query.py calls skip the import and indexing cold start.
+rag_query.py talks to it automatically whenever the socket is live.
+
+Before each query the document signature is re-checked and the index is
+reloaded if RAG_DATA_DIR changed. With no documents the daemon exits
+cleanly (status 0) and rag_query.py falls back to running in-process.
+
+Usage:
+  python3 rag_daemon.py
+"""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from rag_query import RAGEngine, get_config, has_documents
+
+
+class RAGRequestHandler(socketserver.StreamRequestHandler):
+    """One JSON line in ({"question": ...}), one JSON line out."""
+
+    def handle(self):
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            question = json.loads(line)["question"]
+            if self.server.engine.refresh_if_changed():
+                print("Documents changed; index reloaded", flush=True)
+            reply = {"answer": self.server.engine.query_str(question)}
+        except Exception as e:
+            reply = {"error": str(e)}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+
+
+class RAGDaemon(socketserver.UnixStreamServer):
+    """Serves queries one at a time; RAGEngine is not shared across threads."""
+
+    def __init__(self, socket_path, engine):
+        self.engine = engine
+        super().__init__(socket_path, RAGRequestHandler)
+        os.chmod(socket_path, 0o600)
+
+
+def _remove_stale_socket(socket_path):
+    """Unlink a leftover socket file, refusing if another daemon still owns it."""
+    if not os.path.exists(socket_path):
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except OSError:
+            os.unlink(socket_path)
+            return
+    print(f"Another RAG daemon is already listening on {socket_path}", file=sys.stderr)
+    sys.exit(1)
+
+
+def main():
+    config = get_config()
+    socket_path = config["daemon_socket"]
+
+    if not has_documents(config["data_dir"]):
+        print(f"No documents in {config['data_dir']}; RAG daemon not started", flush=True)
+        return
+
+    print("Initializing RAG engine...", flush=True)
+    engine = RAGEngine(config)
+    engine.warmup()
+
+    _remove_stale_socket(socket_path)
+    os.makedirs(os.path.dirname(socket_path) or ".", exist_ok=True)
+    server = RAGDaemon(socket_path, engine)
+    print(f"RAG daemon listening on {socket_path}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        engine.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
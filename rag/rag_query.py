@@ -15,19 +15,36 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
+import json
 import os
+import platform
 import re
+import shutil
+import socket
 import sys
+import threading
+import urllib.error
+import urllib.request
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 
-from llama_index.core import VectorStoreIndex, SimpleDirectoryReader, Settings
-from llama_index.embeddings.ollama import OllamaEmbedding
-from llama_index.embeddings.huggingface import HuggingFaceEmbedding
-from llama_index.llms.ollama import Ollama
-from llama_index.llms.openai import OpenAI
-from llama_index.llms.openai import utils as openai_utils
-from llama_index.llms.openai import base as openai_base
-import tiktoken
+# llama_index, tiktoken and the embedding backends are imported inside the
+# functions that use them, so --help and the config banner start instantly.
+
+# Patterns for the tool_test_N.md direct-lookup fallback, compiled once.
+_TOOL_TEST_RE = re.compile(r"(tool_test_\d+\.md)", re.IGNORECASE)
+_MAGIC_RE = re.compile(r"MAGIC_TOKEN\s*[:=]\s*([A-Za-z0-9._-]+)")
+_HEX_RE = re.compile(r"\b[a-f0-9]{16,64}\b", re.IGNORECASE)
+
+
+def _default_onnx_file():
+    """Pick the int8 ONNX export shipped with all-MiniLM-L6-v2 for this CPU."""
+    if platform.machine().lower() in ("aarch64", "arm64"):
+        return "onnx/model_qint8_arm64.onnx"
+    return "onnx/model_quint8_avx2.onnx"
 
 
 def get_config():
@@ -40,7 +57,19 @@ def get_config():
         "llm_provider": os.getenv("LLM_PROVIDER", "openai"),
         "embed_provider": os.getenv("EMBEDDINGS_PROVIDER", "local"),
         "embed_model": os.getenv("EMBEDDINGS_MODEL", "sentence-transformers/all-MiniLM-L6-v2"),
+        # "onnx" runs the local embedder through ONNX Runtime using the
+        # int8-quantized export named by embed_onnx_file; "torch" is fp32.
+        "embed_backend": os.getenv("EMBEDDINGS_BACKEND", "torch"),
+        "embed_onnx_file": os.getenv("EMBEDDINGS_ONNX_FILE", _default_onnx_file()),
+        # Processes parsing documents while (re)building the index.
+        "reader_workers": int(os.getenv("RAG_READER_WORKERS", str(os.cpu_count() or 1))),
+        # Texts per embedding call; larger batches are faster but hold more RAM.
+        "embed_batch_size": int(os.getenv("EMBED_BATCH_SIZE", "64")),
         "data_dir": os.getenv("RAG_DATA_DIR", os.path.expanduser("~/.openclaw/rag_documents")),
+        # Persisted vector index; set RAG_INDEX_CACHE_DIR= (empty) to rebuild every run.
+        "index_cache_dir": os.getenv("RAG_INDEX_CACHE_DIR", os.path.expanduser("~/.cache/openclaw/rag_index")),
+        # rag_daemon.py serves a warm RAGEngine here; rag_query.py uses it when present.
+        "daemon_socket": os.getenv("RAG_DAEMON_SOCKET", os.path.expanduser("~/.openclaw/rag.sock")),
         "request_timeout": 300.0,
         "temperature": 0.1,
         "chunk_size": 1024,
@@ -49,22 +78,143 @@ def get_config():
     }
 
 
+# Ollama base URLs whose server lacks the batched /api/embed endpoint.
+_EMBED_BATCH_UNSUPPORTED = set()
+
+
+def _ollama_embed_batch(base_url, model_name, texts, timeout):
+    """Embed all texts with one /api/embed call; None if the server can't."""
+    if base_url in _EMBED_BATCH_UNSUPPORTED:
+        return None
+    req = urllib.request.Request(
+        base_url.rstrip("/") + "/api/embed",
+        data=json.dumps({"model": model_name, "input": list(texts)}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            embeddings = json.loads(resp.read()).get("embeddings")
+    except urllib.error.HTTPError as e:
+        if e.code in (400, 404, 405, 501):
+            # Older server: remember and use the per-text endpoint from now on.
+            _EMBED_BATCH_UNSUPPORTED.add(base_url)
+        return None
+    except (OSError, ValueError):
+        return None
+    if not isinstance(embeddings, list) or len(embeddings) != len(texts):
+        _EMBED_BATCH_UNSUPPORTED.add(base_url)
+        return None
+    return embeddings
+
+
+def _ollama_generate_one_token(base_url, model_name, options, timeout):
+    """Load the model with a one-token /api/generate call.
+
+    llama_index's Ollama.complete() ignores max_tokens, so warming up
+    through it would generate a full reply.
+    """
+    req = urllib.request.Request(
+        base_url.rstrip("/") + "/api/generate",
+        data=json.dumps({
+            "model": model_name,
+            "prompt": "hi",
+            "stream": False,
+            "options": dict(options, num_predict=1),
+        }).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        resp.read()
+
+
+QUERY_EMBED_CACHE_SIZE = 1024
+_QUERY_EMBED_CACHE = OrderedDict()
+
+
+class _CachedQueryEmbeddingMixin:
+    """LRU-cache query embeddings so repeated questions skip the embedder."""
+
+    def _query_cache_key(self, query):
+        return (type(self).__name__, self.model_name, query)
+
+    def _cached_query_embedding(self, key):
+        embedding = _QUERY_EMBED_CACHE.get(key)
+        if embedding is not None:
+            _QUERY_EMBED_CACHE.move_to_end(key)
+        return embedding
+
+    def _store_query_embedding(self, key, embedding):
+        _QUERY_EMBED_CACHE[key] = embedding
+        if len(_QUERY_EMBED_CACHE) > QUERY_EMBED_CACHE_SIZE:
+            _QUERY_EMBED_CACHE.popitem(last=False)
+        return embedding
+
+    def _get_query_embedding(self, query):
+        key = self._query_cache_key(query)
+        embedding = self._cached_query_embedding(key)
+        if embedding is None:
+            embedding = self._store_query_embedding(key, super()._get_query_embedding(query))
+        return embedding
+
+    async def _aget_query_embedding(self, query):
+        key = self._query_cache_key(query)
+        embedding = self._cached_query_embedding(key)
+        if embedding is None:
+            embedding = self._store_query_embedding(
+                key, await super()._aget_query_embedding(query)
+            )
+        return embedding
+
+
 def initialize_models(config):
     """Initialize embedding and LLM models"""
+    from llama_index.core import Settings
+
     embed_provider = config.get("embed_provider", "local")
     if embed_provider == "ollama":
-        embed_model = OllamaEmbedding(
+        from llama_index.embeddings.ollama import OllamaEmbedding
+
+        request_timeout = config["request_timeout"]
+
+        class BatchedOllamaEmbedding(_CachedQueryEmbeddingMixin, OllamaEmbedding):
+            """Send each embed_batch_size group as a single /api/embed request."""
+
+            def _get_text_embeddings(self, texts):
+                embeddings = _ollama_embed_batch(
+                    self.base_url, self.model_name, texts, request_timeout
+                )
+                if embeddings is None:
+                    return super()._get_text_embeddings(texts)
+                return embeddings
+
+        embed_model = BatchedOllamaEmbedding(
             model_name=config["embed_model"],
             base_url=config["ollama_base_url"],
             request_timeout=config["request_timeout"],
+            embed_batch_size=config["embed_batch_size"],
         )
     else:
-        embed_model = HuggingFaceEmbedding(
+        from llama_index.embeddings.huggingface import HuggingFaceEmbedding
+
+        class CachedHuggingFaceEmbedding(_CachedQueryEmbeddingMixin, HuggingFaceEmbedding):
+            pass
+
+        embed_kwargs = {}
+        if config.get("embed_backend") == "onnx":
+            embed_kwargs["backend"] = "onnx"
+            embed_kwargs["model_kwargs"] = {"file_name": config["embed_onnx_file"]}
+        embed_model = CachedHuggingFaceEmbedding(
             model_name=config["embed_model"],
+            embed_batch_size=config["embed_batch_size"],
+            **embed_kwargs,
         )
     
     llm_provider = config.get("llm_provider", "openai")
     if llm_provider == "ollama":
+        from llama_index.llms.ollama import Ollama
+
         llm = Ollama(
             model=config["llm_model"],
             base_url=config["ollama_base_url"],
@@ -74,6 +224,11 @@ def initialize_models(config):
             is_function_calling_model=False,
         )
     else:
+        from llama_index.llms.openai import OpenAI
+        from llama_index.llms.openai import utils as openai_utils
+        from llama_index.llms.openai import base as openai_base
+        import tiktoken
+
         if not hasattr(openai_utils, "_original_openai_modelname_to_contextsize"):
             openai_utils._original_openai_modelname_to_contextsize = (
                 openai_utils.openai_modelname_to_contextsize
@@ -118,22 +273,231 @@ def initialize_models(config):
     return embed_model, llm
 
 
-def load_and_index_documents(data_dir, embed_model):
-    """Load documents and create vector index"""
-    
+def _index_signature(data_path, embed_model, embed_variant=""):
+    """Hash the data dir listing plus embedding/chunking settings.
+
+    Any added, removed or modified document (or a different embedder or
+    chunk size) yields a new signature and therefore a fresh index.
+    """
+    from llama_index.core import Settings
+
+    h = hashlib.sha256()
+    h.update(
+        f"{type(embed_model).__name__}:{getattr(embed_model, 'model_name', '')}:"
+        f"{embed_variant}:{Settings.chunk_size}:{Settings.chunk_overlap}".encode()
+    )
+    for path in sorted(data_path.rglob("*")):
+        if path.is_file():
+            st = path.stat()
+            h.update(f"\0{path.relative_to(data_path)}\0{st.st_size}\0{st.st_mtime_ns}".encode())
+    return h.hexdigest()[:16]
+
+
+def _persist_index(index, cache_root, persist_dir):
+    """Write the index to persist_dir and drop stale signatures next to it."""
+    tmp_dir = persist_dir.with_name(persist_dir.name + ".tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    index.storage_context.persist(persist_dir=str(tmp_dir))
+    shutil.rmtree(persist_dir, ignore_errors=True)
+    tmp_dir.replace(persist_dir)
+    for stale in cache_root.iterdir():
+        if stale != persist_dir and stale.is_dir():
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+@lru_cache(maxsize=None)
+def _matrix_vector_store_class():
+    """SimpleVectorStore that answers plain top-k queries with one matrix product.
+
+    llama_index's stock store scores every node in a Python loop, turning
+    each stored list into an array per query. This keeps a contiguous
+    float32 copy of the embeddings, L2-normalized once when it is (lazily)
+    rebuilt after a change, so cosine similarity for the whole corpus is a
+    single BLAS matvec against the normalized query. Filtered, node-restricted and non-default modes fall back
+    to the stock implementation.
+    """
+    import numpy as np
+    from llama_index.core.bridge.pydantic import PrivateAttr
+    from llama_index.core.vector_stores import SimpleVectorStore
+    from llama_index.core.vector_stores.types import (
+        VectorStoreQueryMode,
+        VectorStoreQueryResult,
+    )
+
+    class MatrixVectorStore(SimpleVectorStore):
+        _node_ids: list = PrivateAttr(default=None)
+        _matrix: object = PrivateAttr(default=None)
+
+        def _invalidate(self):
+            self._node_ids = self._matrix = None
+
+        def add(self, *args, **kwargs):
+            self._invalidate()
+            return super().add(*args, **kwargs)
+
+        def delete(self, *args, **kwargs):
+            self._invalidate()
+            return super().delete(*args, **kwargs)
+
+        def delete_nodes(self, *args, **kwargs):
+            self._invalidate()
+            return super().delete_nodes(*args, **kwargs)
+
+        def clear(self, *args, **kwargs):
+            self._invalidate()
+            return super().clear(*args, **kwargs)
+
+        def _ensure_matrix(self):
+            if self._matrix is None:
+                embedding_dict = self.data.embedding_dict
+                self._node_ids = list(embedding_dict)
+                matrix = np.asarray(list(embedding_dict.values()), dtype=np.float32)
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix /= norms
+                self._matrix = matrix
+
+        def query(self, query, **kwargs):
+            if (
+                query.mode != VectorStoreQueryMode.DEFAULT
+                or query.query_embedding is None
+                or query.filters is not None
+                or query.node_ids
+                or query.doc_ids
+                or not self.data.embedding_dict
+            ):
+                return super().query(query, **kwargs)
+
+            self._ensure_matrix()
+            q = np.array(query.query_embedding, dtype=np.float32)
+            q /= float(np.linalg.norm(q)) or 1.0
+            scores = self._matrix @ q
+
+            k = min(query.similarity_top_k or 1, len(scores))
+            if k < len(scores):
+                top = np.argpartition(-scores, k - 1)[:k]
+            else:
+                top = np.arange(len(scores))
+            top = top[np.argsort(-scores[top])]
+            return VectorStoreQueryResult(
+                similarities=scores[top].tolist(),
+                ids=[self._node_ids[i] for i in top],
+            )
+
+    return MatrixVectorStore
+
+
+PARALLEL_READ_MIN_FILES = 32
+
+
+def _iter_documents(reader, num_workers=1):
+    """Yield lists of parsed documents, one file at a time.
+
+    Small corpora are read serially: a spawned worker re-imports llama_index,
+    which costs more than it saves on a few files. Larger ones are parsed by
+    a single process pool for the whole ingest, using the reader's own
+    per-file loader and options so results match iter_data().
+    """
+    files = reader.input_files
+    if num_workers <= 1 or len(files) < PARALLEL_READ_MIN_FILES:
+        yield from reader.iter_data()
+        return
+    import multiprocessing
+    from functools import partial
+
+    load_file = partial(
+        type(reader).load_file,
+        file_metadata=reader.file_metadata,
+        file_extractor=reader.file_extractor,
+        filename_as_id=reader.filename_as_id,
+        encoding=reader.encoding,
+        errors=reader.errors,
+        raise_on_error=reader.raise_on_error,
+        fs=reader.fs,
+    )
+    with multiprocessing.get_context("spawn").Pool(num_workers) as pool:
+        for docs in pool.imap(load_file, files, chunksize=4):
+            yield reader._exclude_metadata(docs)
+
+
+def has_documents(data_dir):
+    """True if data_dir holds at least one non-hidden file for the reader to index."""
+    data_path = Path(data_dir)
+    if not data_path.is_dir():
+        return False
+    for path in data_path.rglob("*"):
+        rel_parts = path.relative_to(data_path).parts
+        if path.is_file() and not any(part.startswith(".") for part in rel_parts):
+            return True
+    return False
+
+
+def load_and_index_documents(
+    data_dir, embed_model, cache_dir=None, embed_variant="", num_workers=1, signature=None
+):
+    """Load documents and create vector index, reusing a persisted one when current"""
+    from llama_index.core import (
+        Settings,
+        StorageContext,
+        VectorStoreIndex,
+        SimpleDirectoryReader,
+        load_index_from_storage,
+    )
+
     data_path = Path(data_dir)
     
     if not data_path.exists():
         raise FileNotFoundError(f"Data directory '{data_dir}' not found.")
+
+    persist_dir = None
+    if cache_dir:
+        cache_root = Path(cache_dir)
+        persist_dir = cache_root / (
+            signature or _index_signature(data_path, embed_model, embed_variant)
+        )
+        if persist_dir.is_dir():
+            try:
+                storage_context = StorageContext.from_defaults(
+                    persist_dir=str(persist_dir),
+                    vector_store=_matrix_vector_store_class().from_persist_dir(str(persist_dir)),
+                )
+                index = load_index_from_storage(storage_context, embed_model=embed_model)
+                print(f"Loaded cached index for {data_dir} from {persist_dir}")
+                return index
+            except Exception as e:
+                print(f"Warning: ignoring unreadable index cache {persist_dir}: {e}", file=sys.stderr)
     
-    docs = SimpleDirectoryReader(str(data_path)).load_data()
-    
-    if not docs:
+    reader = SimpleDirectoryReader(str(data_path))
+    storage_context = StorageContext.from_defaults(vector_store=_matrix_vector_store_class()())
+    index = VectorStoreIndex(nodes=[], storage_context=storage_context, embed_model=embed_model)
+
+    # Stream files -> chunks -> embeddings: only the current group's text
+    # and one embedding batch of pending chunks are held besides the index.
+    batch_size = max(1, getattr(embed_model, "embed_batch_size", 64))
+    pending = []
+    doc_count = 0
+    for docs in _iter_documents(reader, num_workers):
+        for doc in docs:
+            index.docstore.set_document_hash(doc.get_doc_id(), doc.hash)
+        pending.extend(Settings.node_parser.get_nodes_from_documents(docs))
+        doc_count += len(docs)
+        if len(pending) >= batch_size:
+            index.insert_nodes(pending)
+            pending = []
+    if pending:
+        index.insert_nodes(pending)
+
+    if not doc_count:
         raise ValueError(f"No documents found in {data_dir}")
     
-    print(f"Loaded {len(docs)} document(s) from {data_dir}")
-    
-    index = VectorStoreIndex.from_documents(docs, embed_model=embed_model)
+    print(f"Loaded {doc_count} document(s) from {data_dir}")
+
+    if persist_dir is not None:
+        try:
+            cache_root.mkdir(parents=True, exist_ok=True)
+            _persist_index(index, cache_root, persist_dir)
+        except OSError as e:
+            print(f"Warning: could not persist index to {persist_dir}: {e}", file=sys.stderr)
     
     return index
 
@@ -150,6 +514,28 @@ def create_query_engine(index, llm, similarity_top_k=3):
     return query_engine
 
 
+@lru_cache(maxsize=128)
+def _extract_hint(path_str, mtime_ns):
+    """Pull the answer token out of a tool_test file.
+
+    mtime_ns is only part of the cache key, so an edited file is re-read.
+    """
+    text = Path(path_str).read_text(encoding="utf-8", errors="ignore")
+
+    magic = _MAGIC_RE.search(text)
+    if magic:
+        return magic.group(1)
+
+    hex_token = _HEX_RE.search(text)
+    if hex_token:
+        return hex_token.group(0)
+
+    stripped = text.strip()
+    if not stripped:
+        return ""
+    return stripped.splitlines()[0]
+
+
 class RAGEngine:
     """Reusable RAG engine that can be initialized once and queried multiple times."""
 
@@ -157,44 +543,102 @@ class RAGEngine:
         self.config = config or get_config()
         self.data_path = Path(self.config["data_dir"])
         self.embed_model, self.llm = initialize_models(self.config)
-        self.index = load_and_index_documents(self.config["data_dir"], self.embed_model)
+        self._embed_variant = ""
+        if self.config.get("embed_backend") == "onnx":
+            self._embed_variant = self.config["embed_onnx_file"]
+        self.index_signature = None
+        self._loop = None
+        self._load_index()
+
+    def _current_signature(self):
+        if not self.data_path.exists():
+            return None
+        return _index_signature(self.data_path, self.embed_model, self._embed_variant)
+
+    def _load_index(self):
+        """Build (or load from cache) the indexes for the current data dir."""
+        signature = self._current_signature()
+        file_index = self._build_file_index()
+        index = load_and_index_documents(
+            self.config["data_dir"],
+            self.embed_model,
+            self.config.get("index_cache_dir"),
+            self._embed_variant,
+            self.config.get("reader_workers", 1),
+            signature,
+        )
         self.query_engine = create_query_engine(
-            self.index, self.llm, self.config["similarity_top_k"]
+            index, self.llm, self.config["similarity_top_k"]
         )
+        self.index = index
+        self._file_index = file_index
+        self.index_signature = signature
+
+    def refresh_if_changed(self):
+        """Reload the index if documents changed since it was built.
+
+        Models stay loaded; only the data dir is re-read (or the persisted
+        index for the new signature is loaded). Returns True on reload.
+        """
+        if self._current_signature() == self.index_signature:
+            return False
+        self._load_index()
+        return True
+
+    def warmup(self):
+        """Make the embedder and LLM load their weights before the first question.
+
+        One short embedding and completion; failures are only reported, since
+        the real query will surface them anyway.
+        """
+        try:
+            self.embed_model.get_query_embedding("warmup")
+            if self.config.get("llm_provider", "openai") == "ollama":
+                # Same num_ctx as real queries, or Ollama reloads the model.
+                _ollama_generate_one_token(
+                    self.config["ollama_base_url"],
+                    self.config["llm_model"],
+                    {"temperature": self.llm.temperature, "num_ctx": self.llm.context_window},
+                    self.config["request_timeout"],
+                )
+            else:
+                self.llm.complete("hi", max_tokens=1)
+        except Exception as e:
+            print(f"Warning: RAG warmup failed: {e}", file=sys.stderr)
+
+    def _build_file_index(self):
+        """Map basename -> first matching path under the data dir."""
+        index = {}
+        for path in self.data_path.rglob("*"):
+            if path.is_file():
+                index.setdefault(path.name, path)
+        return index
 
     def _direct_file_hint_lookup(self, question):
         """Deterministic fallback for explicit tool_test filename queries."""
         if not question:
             return None
 
-        match = re.search(r"(tool_test_\d+\.md)", str(question), re.IGNORECASE)
+        question = str(question)
+        # Cheap literal check first; almost no real question names a test file.
+        if "tool_test_" not in question.lower():
+            return None
+
+        match = _TOOL_TEST_RE.search(question)
         if not match:
             return None
 
         filename = match.group(1)
         candidate = self.data_path / filename
         if not candidate.exists():
-            matches = list(self.data_path.rglob(filename))
-            if matches:
-                candidate = matches[0]
+            candidate = self._file_index.get(filename, candidate)
 
-        if not candidate.exists():
+        try:
+            mtime_ns = candidate.stat().st_mtime_ns
+        except OSError:
             return None
 
-        text = candidate.read_text(encoding="utf-8", errors="ignore")
-
-        magic = re.search(r"MAGIC_TOKEN\s*[:=]\s*([A-Za-z0-9._-]+)", text)
-        if magic:
-            return magic.group(1)
-
-        hex_token = re.search(r"\b[a-f0-9]{16,64}\b", text, re.IGNORECASE)
-        if hex_token:
-            return hex_token.group(0)
-
-        stripped = text.strip()
-        if not stripped:
-            return ""
-        return stripped.splitlines()[0]
+        return _extract_hint(str(candidate), mtime_ns)
 
     def query(self, question):
         """Run a single query and return the response object."""
@@ -207,19 +651,115 @@ class RAGEngine:
         """Run a single query and return the response as a string."""
         return str(self.query(question))
 
-    def batch_query(self, questions):
-        """Run multiple queries. Returns list of (question, response_str, error) tuples."""
-        results = []
-        for q in questions:
-            try:
-                results.append((q, self.query_str(q), None))
-            except Exception as e:
-                results.append((q, None, str(e)))
-        return results
+    async def aquery_str(self, question):
+        """Async variant of query_str."""
+        direct = self._direct_file_hint_lookup(question)
+        if direct is not None:
+            return str(direct)
+        return str(await self.query_engine.aquery(question))
+
+    async def abatch_query(self, questions, concurrency=4):
+        """Run queries concurrently, at most `concurrency` in flight.
+
+        Returns (question, response_str, error) tuples in input order.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(q):
+            async with semaphore:
+                try:
+                    return (q, await self.aquery_str(q), None)
+                except Exception as e:
+                    return (q, None, str(e))
+
+        return list(await asyncio.gather(*(run_one(q) for q in questions)))
+
+    def batch_query(self, questions, concurrency=4):
+        """Run multiple queries. Returns list of (question, response_str, error) tuples.
+
+        Batches share one event loop kept on the engine, so the LLM's reused
+        async client stays bound to the loop it was created on. Inside an
+        already running loop the queries run serially instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            results = []
+            for q in questions:
+                try:
+                    results.append((q, self.query_str(q), None))
+                except Exception as e:
+                    results.append((q, None, str(e)))
+            return results
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(self.abatch_query(questions, concurrency))
+
+    def close(self):
+        """Close the event loop batch_query() keeps, if one was created."""
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class RAGDaemonClient:
+    """Send queries to a running rag_daemon.py over its Unix socket.
+
+    One connection per query: a JSON line {"question": ...} goes out and a
+    JSON line {"answer": ...} or {"error": ...} comes back.
+    """
+
+    def __init__(self, socket_path, timeout):
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    @classmethod
+    def connect(cls, config):
+        """Return a client if a daemon is listening, else None."""
+        socket_path = config.get("daemon_socket")
+        if not socket_path or not os.path.exists(socket_path):
+            return None
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(2)
+                sock.connect(socket_path)
+        except OSError:
+            return None
+        return cls(socket_path, config["request_timeout"] + 30)
+
+    def query(self, question):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            sock.sendall(json.dumps({"question": question}).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+        if not line:
+            raise RuntimeError("RAG daemon closed the connection without replying")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["answer"]
+
+    query_str = query
+
+    def close(self):
+        """Nothing to release; each query uses its own connection."""
 
 
 def interactive_mode(engine):
     """Run interactive query mode"""
+    if isinstance(engine, RAGEngine):
+        # Load model weights while the user is typing the first question.
+        threading.Thread(target=engine.warmup, daemon=True).start()
     print("\nRAG system ready. Type 'quit' to exit.")
     print("-" * 40)
 
@@ -256,8 +796,18 @@ def main():
         "--interactive", "-i", action="store_true",
         help="Run in interactive mode"
     )
+    parser.add_argument(
+        "--daemon", action="store_true",
+        help="Serve queries on RAG_DAEMON_SOCKET (same as running rag_daemon.py)"
+    )
     args = parser.parse_args()
 
+    if args.daemon:
+        import rag_daemon  # sits next to this script
+
+        rag_daemon.main()
+        return
+
     config = get_config()
     print(f"RAG Configuration:")
     print(f"  LLM Provider: {config['llm_provider']}")
@@ -266,27 +816,37 @@ def main():
     print(f"  LLM Model: {config['llm_model']}")
     print(f"  Embed Provider: {config['embed_provider']}")
     print(f"  Embed Model: {config['embed_model']}")
+    if config["embed_provider"] != "ollama":
+        print(f"  Embed Backend: {config['embed_backend']}")
     print(f"  Data Dir: {config['data_dir']}")
+    print(f"  Index Cache: {config['index_cache_dir'] or '(disabled)'}")
     print()
 
-    print("Initializing RAG engine...")
-    engine = RAGEngine(config)
-
-    if args.interactive:
-        interactive_mode(engine)
-    elif args.query:
-        response = engine.query(args.query)
-        print(f"\n{response}")
-    elif not sys.stdin.isatty():
-        question = sys.stdin.read().strip()
-        if question:
-            response = engine.query(question)
+    engine = RAGDaemonClient.connect(config)
+    if engine is not None:
+        print(f"Using RAG daemon at {config['daemon_socket']}")
+    else:
+        print("Initializing RAG engine...")
+        engine = RAGEngine(config)
+
+    try:
+        if args.interactive:
+            interactive_mode(engine)
+        elif args.query:
+            response = engine.query(args.query)
             print(f"\n{response}")
+        elif not sys.stdin.isatty():
+            question = sys.stdin.read().strip()
+            if question:
+                response = engine.query(question)
+                print(f"\n{response}")
+            else:
+                print("No query provided on stdin.", file=sys.stderr)
+                sys.exit(1)
         else:
-            print("No query provided on stdin.", file=sys.stderr)
-            sys.exit(1)
-    else:
-        interactive_mode(engine)
+            interactive_mode(engine)
+    finally:
+        engine.close()
 
 
 if __name__ == "__main__":
@@ -16,13 +16,12 @@ TEST_QUERIES = [
 
 def run_tests():
     print("Initializing RAG engine for testing...")
-    engine = RAGEngine()
+    with RAGEngine() as engine:
+        print("\n" + "=" * 50)
+        print("RAG System Test Results")
+        print("=" * 50)
 
-    print("\n" + "=" * 50)
-    print("RAG System Test Results")
-    print("=" * 50)
-
-    results = engine.batch_query(TEST_QUERIES)
+        results = engine.batch_query(TEST_QUERIES)
     all_passed = True
 
     for i, (question, response, error) in enumerate(results, 1):
@@ -13,8 +13,24 @@ import os
 class DebugHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Serve static files and emit request logs at DEBUG level."""
 
+    _log = logging.getLogger("unified_chat_facade.http")
+
+    def copyfile(self, source, outputfile) -> None:
+        """Send file bodies with sendfile(2) instead of copying through Python.
+
+        socket.sendfile() falls back to plain send() for in-memory sources
+        such as directory listings.
+        """
+        if outputfile is self.wfile:
+            self.connection.sendfile(source)
+        else:
+            super().copyfile(source, outputfile)
+
     def log_message(self, format: str, *args) -> None:  # noqa: A003
-        logging.getLogger("unified_chat_facade.http").debug(
+        # Skip the timestamp and message formatting entirely above DEBUG.
+        if not self._log.isEnabledFor(logging.DEBUG):
+            return
+        self._log.debug(
             "%s - - [%s] %s",
             self.client_address[0],
             self.log_date_time_string(),